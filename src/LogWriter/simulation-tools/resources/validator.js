@@ -4,7 +4,9 @@ const ucum = require("@lhncbc/ucum-lhc");
 const ucumUtils = ucum.UcumLhcUtils.getInstance();
 
 const validText = "valid";
+const errorText = "error";
 const resultSeparator = ";";
+const streamArgument = "--stdin";
 
 function validate_ucum_code(unit_code) {
     // Uses the ucum-lhc library to validate the given unit_code as a valid UCUM unit code.
@@ -17,5 +19,21 @@ function validate_ucum_code(unit_code) {
     return [result.status, description].join(resultSeparator);
 }
 
-// Use the first command line parameter as the unit code to be validated and write result to the condole.
-console.log(validate_ucum_code(process.argv[2]));
+if (process.argv[2] === streamArgument) {
+    // Read the unit codes from the standard input, one code per line, and write the result for each code
+    // to the console on its own line. The process stays running until the standard input is closed.
+    const readline = require("readline");
+    const lineReader = readline.createInterface({input: process.stdin, terminal: false});
+    lineReader.on("line", function(unit_code) {
+        try {
+            console.log(validate_ucum_code(unit_code));
+        }
+        catch (error) {
+            console.log([errorText, ""].join(resultSeparator));
+        }
+    });
+}
+else {
+    // Use the first command line parameter as the unit code to be validated and write result to the condole.
+    console.log(validate_ucum_code(process.argv[2]));
+}
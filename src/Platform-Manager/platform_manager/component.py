@@ -17,6 +17,12 @@ import yaml
 
 from tools.tools import FullLogger
 
+# Use the LibYAML based loader when PyYAML has been built with it, since it is considerably faster.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore
+
 LOGGER = FullLogger(__name__)
 
 PLATFORM_COMPONENT_TYPE = "platform"  # a component managed by the platform, deployed using Docker
@@ -98,17 +104,21 @@ class ComponentParameters:
 class ComponentCollectionParameters:
     """
     Data class for holding information about the supported component types and their parameters.
-    - component_types: a dictionary containing information about each of the supported component types
+    - component_types: a dictionary containing information about each of the supported component types,
+                       the dictionary is updated in place when new component types are added
     """
     component_types: Dict[str, ComponentParameters] = dataclasses.field(default_factory=dict)
 
     def add_type(self, component_type: str, component_parameters: ComponentParameters, replace: bool = True) -> bool:
         """Combines the given component parameters to the current collection."""
-        if not replace and component_type in self.component_types:
-            LOGGER.debug("Did not replace component '{}' definition: replace={}".format(component_type, replace))
-            return False
+        if replace:
+            self.component_types[component_type] = component_parameters
+            return True
 
-        self.component_types[component_type] = component_parameters
+        # add the component type only if it has not been registered yet, using a single dictionary lookup
+        if self.component_types.setdefault(component_type, component_parameters) is not component_parameters:
+            LOGGER.debug("Did not replace component '%s' definition: replace=%s", component_type, replace)
+            return False
         return True
 
 
@@ -146,12 +156,19 @@ def get_component_type_parameters(component_type_definition: Dict[str, Any]) ->
     )
 
 
-def load_component_parameters_from_yaml(yaml_filename: pathlib.Path) -> Optional[Tuple[str, ComponentParameters]]:
-    """Loads and returns the component name and type specification from a YAML file."""
-    try:
-        with open(yaml_filename, mode="r", encoding="UTF-8") as component_file:
-            component_type_definition = yaml.safe_load(component_file)
+def read_component_type_definition(yaml_filename: pathlib.Path) -> Any:
+    """
+    Reads and returns the contents of the given YAML file.
+    Raises OSError or yaml.YAMLError if there is a problem reading the file.
+    """
+    with open(yaml_filename, mode="rb") as component_file:
+        return yaml.load(component_file, Loader=YamlSafeLoader)
 
+
+def get_component_parameters_from_definition(component_type_definition: Any, yaml_filename: pathlib.Path) \
+        -> Optional[Tuple[str, ComponentParameters]]:
+    """Returns the component name and type specification from the contents of the given YAML file."""
+    try:
         if not isinstance(component_type_definition, dict):
             LOGGER.warning("The file '{}' does not contain a dictionary.".format(yaml_filename))
             return None
@@ -173,8 +190,8 @@ def load_component_parameters_from_yaml(yaml_filename: pathlib.Path) -> Optional
         LOGGER.info("Loaded definition for '{}' from {}".format(component_name, yaml_filename))
         return component_name, component_type_parameters
 
-    except (OSError, TypeError, yaml.YAMLError) as yaml_error:
+    except TypeError as type_error:
         LOGGER.error("Encountered '{}' exception when loading component type definitions from '{}': {}".format(
-            type(yaml_error).__name__, yaml_filename, yaml_error
+            type(type_error).__name__, yaml_filename, type_error
         ))
         return None
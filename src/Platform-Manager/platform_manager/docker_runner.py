@@ -7,14 +7,17 @@
 """This module contains the functionality for starting Docker containers."""
 
 import asyncio
-import inspect
-import re
-from typing import cast, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from typing import Any, Awaitable, Callable, cast, Dict, List, Optional, Tuple, Union
 
 from aiodocker import Docker
 from aiodocker.exceptions import DockerError
 from aiodocker.containers import DockerContainer
-from aiohttp.client_exceptions import ClientError
+from aiodocker.networks import DockerNetwork
+from aiohttp import UnixConnector
+from aiohttp.client_exceptions import ClientConnectionError, ClientError, ServerDisconnectedError
 from docker import from_env as docker_client_from_env, DockerClient
 from docker.errors import APIError
 from docker.models.containers import Container
@@ -24,11 +27,119 @@ from tools.tools import EnvironmentVariableValue, FullLogger, async_wrap
 
 LOGGER = FullLogger(__name__)
 
+# The maximum number of connections the synchronous Docker client keeps to the Docker Engine.
+# The default of the docker library (10) would serialize larger batches of concurrent requests.
+DOCKER_SYNCHRONOUS_POOL_SIZE = 32
+
+# The connection settings for the aiodocker client when the Docker Engine is accessed through a Unix socket.
+DOCKER_HOST = "DOCKER_HOST"
+DOCKER_UNIX_SOCKET_PREFIX = "unix://"
+DOCKER_DEFAULT_SOCKET_PATH = "/var/run/docker.sock"
+DOCKER_CONNECTION_LIMIT = 64
+DOCKER_KEEPALIVE_TIMEOUT = 75.0
+
+# The maximum number of threads used for the blocking calls with the docker library.
+DOCKER_EXECUTOR_MAX_WORKERS = 16
+
+# The allowed characters for the simulation index in the container names, i.e. only ASCII digits.
+INDEX_DIGITS = frozenset("0123456789")
+ORD_ZERO = ord("0")
+
+# The Docker clients shared by all ContainerStarter instances in the process.
+_SHARED_DOCKER = None  # type: Optional[Docker]
+_SHARED_DOCKER_SYNCHRONOUS = None  # type: Optional[DockerClient]
+# The thread pool for the docker library calls, kept separate from the default executor of the event loop.
+_DOCKER_EXECUTOR = None  # type: Optional[ThreadPoolExecutor]
+
+
+async def _run_synchronous(synchronous_function: Callable, *args, **kwargs) -> Any:
+    """Runs the given blocking function in the thread pool dedicated to the docker library calls."""
+    global _DOCKER_EXECUTOR  # pylint: disable=global-statement
+    if _DOCKER_EXECUTOR is None:
+        _DOCKER_EXECUTOR = ThreadPoolExecutor(
+            max_workers=DOCKER_EXECUTOR_MAX_WORKERS, thread_name_prefix="simces-docker-sync")
+    return await async_wrap(synchronous_function)(*args, executor=_DOCKER_EXECUTOR, **kwargs)
+
+
+def _create_docker_client() -> Docker:
+    """
+    Creates a new Docker client (aiodocker library).
+    For Unix socket connections, the client uses a connector with a larger connection limit and
+    an explicit keep-alive timeout. For other connection types, the aiodocker defaults are used.
+    """
+    docker_host = os.environ.get(DOCKER_HOST, DOCKER_UNIX_SOCKET_PREFIX + DOCKER_DEFAULT_SOCKET_PATH)
+    if not docker_host.startswith(DOCKER_UNIX_SOCKET_PREFIX):
+        return Docker()
+
+    socket_path = docker_host[len(DOCKER_UNIX_SOCKET_PREFIX):]
+    if not os.path.exists(socket_path):
+        # let aiodocker search for the socket from its default locations
+        return Docker()
+
+    connector = UnixConnector(
+        path=socket_path,
+        limit=DOCKER_CONNECTION_LIMIT,
+        keepalive_timeout=DOCKER_KEEPALIVE_TIMEOUT
+    )
+    # the same dummy hostname that aiodocker uses for the Unix socket connections
+    return Docker(url=DOCKER_UNIX_SOCKET_PREFIX + "localhost", connector=connector)
+
+
+def get_shared_docker() -> Docker:
+    """Returns the shared Docker client (aiodocker library). The client is created at the first call."""
+    global _SHARED_DOCKER  # pylint: disable=global-statement
+    if _SHARED_DOCKER is None:
+        _SHARED_DOCKER = _create_docker_client()
+    return _SHARED_DOCKER
+
+
+async def get_shared_docker_synchronous() -> DockerClient:
+    """Returns the shared Docker client (docker library). The client is created at the first call."""
+    global _SHARED_DOCKER_SYNCHRONOUS  # pylint: disable=global-statement
+    if _SHARED_DOCKER_SYNCHRONOUS is None:
+        _SHARED_DOCKER_SYNCHRONOUS = await _run_synchronous(
+            docker_client_from_env, max_pool_size=DOCKER_SYNCHRONOUS_POOL_SIZE)
+    return _SHARED_DOCKER_SYNCHRONOUS
+
+
+async def close_shared_docker_clients():
+    """
+    Closes the shared Docker client connections and the thread pool used with them.
+    Should be called only when the process is shutting down.
+    """
+    global _SHARED_DOCKER, _SHARED_DOCKER_SYNCHRONOUS, _DOCKER_EXECUTOR  # pylint: disable=global-statement
+    if _SHARED_DOCKER is not None:
+        await _SHARED_DOCKER.close()
+        _SHARED_DOCKER = None
+    if _SHARED_DOCKER_SYNCHRONOUS is not None:
+        await _run_synchronous(_SHARED_DOCKER_SYNCHRONOUS.close)
+        _SHARED_DOCKER_SYNCHRONOUS = None
+    if _DOCKER_EXECUTOR is not None:
+        _DOCKER_EXECUTOR.shutdown(wait=True)
+        _DOCKER_EXECUTOR = None
+
+
+async def _with_stale_retry(coroutine_function: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """
+    Awaits the given coroutine function with the given arguments and retries the call once if the connection
+    to the Docker Engine was found to be stale, for example, after the Docker daemon has been restarted.
+    """
+    try:
+        return await coroutine_function(*args, **kwargs)
+    except (ClientConnectionError, ServerDisconnectedError) as connection_error:
+        LOGGER.debug("Retrying after stale Docker connection: {}: {}".format(
+            type(connection_error).__name__, connection_error))
+        return await coroutine_function(*args, **kwargs)
+
 
 def get_container_name(container: DockerContainer) -> str:
     """Returns the name of the given Docker container."""
     # Use a hack to get the container name because the aiodocker does not make it otherwise available.
-    return container._container.get("Names", [" "])[0][1:]  # pylint: disable=protected-access
+    # The container list from the Docker Engine always includes the names, the exception is only a safeguard.
+    try:
+        return container._container["Names"][0][1:]  # pylint: disable=protected-access
+    except (KeyError, IndexError):
+        return ""
 
 
 class ContainerConfiguration:
@@ -47,22 +158,24 @@ class ContainerConfiguration:
         """
         self.__name = container_name
         self.__image = docker_image
-        self.__environment = [
-            "=".join([
-                variable_name, str(variable_value)
-            ])
+        # the formatted value is the same as str(variable_value) for all the allowed value types
+        self.__environment = tuple(
+            f"{variable_name}={variable_value}"
             for variable_name, variable_value in environment.items()
-        ]
+        )
 
         if isinstance(networks, str):
-            self.__networks = [networks]
+            self.__networks = (networks,)
         else:
-            self.__networks = networks
+            self.__networks = tuple(networks)
 
         if isinstance(volumes, str):
-            self.__volumes = [volumes]
+            self.__volumes = (volumes,)
         else:
-            self.__volumes = volumes
+            self.__volumes = tuple(volumes)
+
+        # the configuration for the aiodocker library is created at the first use
+        self.__aiodocker_config = None  # type: Optional[Dict[str, Any]]
 
     @property
     def container_name(self) -> str:
@@ -75,66 +188,149 @@ class ContainerConfiguration:
         return self.__image
 
     @property
-    def environment(self) -> List[str]:
+    def environment(self) -> Tuple[str, ...]:
         """The environment variables for the Docker container."""
         return self.__environment
 
     @property
-    def networks(self) -> List[str]:
+    def networks(self) -> Tuple[str, ...]:
         """The Docker networks for the Docker container."""
         return self.__networks
 
     @property
-    def volumes(self) -> List[str]:
+    def volumes(self) -> Tuple[str, ...]:
         """The Docker volumes for the Docker container."""
         return self.__volumes
 
+    @property
+    def aiodocker_config(self) -> Dict[str, Any]:
+        """
+        The container configuration in the format required by aiodocker when creating the container.
+        Only the first network is included since a container can be connected to one network at creation.
+        The same dictionary is returned at each call and it should not be modified.
+        """
+        if self.__aiodocker_config is None:
+            # The API specification for Docker Engine: https://docs.docker.com/engine/api/v1.40/
+            if self.__networks:
+                first_network = {self.__networks[0]: {}}
+            else:
+                first_network = {}
+
+            self.__aiodocker_config = {
+                "Image": self.__image,
+                "Env": self.__environment,
+                "HostConfig": {
+                    "Binds": self.__volumes,
+                    "AutoRemove": True
+                },
+                "NetworkingConfig": {
+                    "EndpointsConfig": first_network
+                }
+            }
+
+        return self.__aiodocker_config
+
 
 class ContainerStarter:
     """Class for starting the Docker components for a simulation."""
     PREFIX_DIGITS = 2
     PREFIX_START = "Sim"
-
-    def __init__(self):
-        """Sets up the Docker client."""
-        self.__container_prefix = "{:s}{{index:0{:d}d}}_".format(
-            self.__class__.PREFIX_START, self.__class__.PREFIX_DIGITS)     # Sim{index:02d}_
-        self.__prefix_pattern = re.compile("{:s}([0-9]{{{:d}}})_".format(
-            self.__class__.PREFIX_START, self.__class__.PREFIX_DIGITS))    # Sim([0-9]{2})_
-
+    # the position of the simulation identifier (the simulation index) in the container names
+    IDENTIFIER_SLICE = slice(len(PREFIX_START), len(PREFIX_START) + PREFIX_DIGITS)
+
+    # The values derived from the container name prefix, computed once when the class is created.
+    __CONTAINER_PREFIX = "{:s}{{index:0{:d}d}}_".format(PREFIX_START, PREFIX_DIGITS)     # Sim{index:02d}_
+    # the position of the separator following the simulation index in the container names
+    __SEPARATOR_POSITION = len(PREFIX_START) + PREFIX_DIGITS
+    # the container name filter for the Docker Engine API, the names are still checked locally
+    __NAME_FILTER = json.dumps({"name": [PREFIX_START]})
+    # the value for the "all" parameter of the container list request to include also the containers that are
+    # not running, a created or a stopped container still reserves its name
+    __LIST_ALL_CONTAINERS = "1"
+    # the response status for a container name conflict and the status of a container that has not been started
+    __HTTP_CONFLICT = 409
+    __CREATED_STATUS = "created"
+    # the bit mask with a set bit for each possible simulation index
+    __ALL_INDEXES_MASK = (1 << 10 ** PREFIX_DIGITS) - 1
+
+    def __init__(self, docker_client: Optional[Docker] = None):
+        """
+        Sets up the Docker client.
+        - docker_client: the Docker client (aiodocker library), if None, the shared client is used
+        """
         # the docker client using aiodocker library
-        self.__docker_client = Docker()
-        # the docker client using docker library, used only if necessary
-        self.__docker_client_synchronous = None  # type: Optional[DockerClient]
+        if docker_client is None:
+            docker_client = get_shared_docker()
+        self.__docker_client = docker_client
 
         self.__lock = asyncio.Lock()
 
     async def close(self):
-        """Closes the Docker client connection."""
-        await self.__docker_client.close()
+        """
+        Closes the Docker client connection if it is not the shared client.
+        The shared clients are closed with close_shared_docker_clients().
+        """
+        if self.__docker_client is not _SHARED_DOCKER:
+            await self.__docker_client.close()
 
     async def get_next_simulation_index(self) -> Union[int, None]:
         """
         Returns the next available index for the container name prefix for a new simulation.
         If all possible indexes are already in use, returns None.
+        The indexes in use are fetched from the Docker Engine at each call, since the containers can be removed
+        automatically or created by other processes at any time.
         """
-        running_containers = cast(List[DockerContainer], await self.__docker_client.containers.list())
-        simulation_indexes = {
-            int(get_container_name(container)[len(self.__class__.PREFIX_START):][:self.__class__.PREFIX_DIGITS])
-            for container in running_containers
-            if self.__prefix_pattern.match(get_container_name(container)) is not None
-        }
+        used_indexes_mask = await self.__get_used_indexes_mask()
+        return self.__get_free_simulation_index(used_indexes_mask)
 
-        if simulation_indexes:
-            index_limit = 10 ** self.__class__.PREFIX_DIGITS
-            available_indexes = set(range(index_limit)) - simulation_indexes
-            if available_indexes:
-                return min(available_indexes)
-            # no available simulation indexes available
+    async def __get_used_indexes_mask(self) -> int:
+        """
+        Returns a bit mask of the simulation indexes used by the existing containers,
+        bit i is set when index i is in use.
+        """
+        # let the Docker Engine filter out the containers without the simulation prefix in their names
+        existing_containers = cast(
+            List[DockerContainer],
+            await _with_stale_retry(
+                self.__docker_client.containers.list,
+                all=self.__class__.__LIST_ALL_CONTAINERS,
+                filters=self.__class__.__NAME_FILTER))
+        used_indexes_mask = 0
+        for container in existing_containers:
+            simulation_index = self.__get_simulation_index(get_container_name(container))
+            if simulation_index is not None:
+                used_indexes_mask |= 1 << simulation_index
+
+        return used_indexes_mask
+
+    def __get_simulation_index(self, container_name: str) -> Optional[int]:
+        """Returns the simulation index for the given container name or None if the name has no simulation prefix."""
+        # the name format is checked without regular expressions, i.e. Sim([0-9]{2})_
+        if (len(container_name) <= self.__class__.__SEPARATOR_POSITION or
+                container_name[self.__class__.__SEPARATOR_POSITION] != "_" or
+                not container_name.startswith(self.__class__.PREFIX_START)):
             return None
+        simulation_index = 0
+        for index_digit in container_name[self.__class__.IDENTIFIER_SLICE]:
+            if index_digit not in INDEX_DIGITS:
+                return None
+            simulation_index = simulation_index * 10 + ord(index_digit) - ORD_ZERO
+        return simulation_index
 
-        # no previous simulation containers found
-        return 0
+    def __get_free_simulation_index(self, used_indexes_mask: int) -> Optional[int]:
+        """
+        Returns the smallest simulation index that is not marked as used in the given bit mask
+        or None if all indexes are in use.
+        """
+        if not used_indexes_mask:
+            # no simulation containers found
+            return 0
+
+        free_indexes_mask = ~used_indexes_mask & self.__class__.__ALL_INDEXES_MASK
+        if not free_indexes_mask:
+            return None
+        # the position of the lowest set bit
+        return (free_indexes_mask & -free_indexes_mask).bit_length() - 1
 
     async def create_container(self, container_name: str, container_configuration: ContainerConfiguration) \
             -> Optional[Union[DockerContainer, Container]]:
@@ -142,29 +338,9 @@ class ContainerStarter:
         Creates and returns a Docker container according to the given configuration.
         Uses the 'aiodocker' library by default and if that throws an exception, tries using the 'docker' library.
         """
-        # The API specification for Docker Engine: https://docs.docker.com/engine/api/v1.40/
         LOGGER.debug("Creating container: {:s}".format(container_name))
-        if container_configuration.networks:
-            first_network_name = container_configuration.networks[0]
-            first_network = {first_network_name: {}}
-        else:
-            first_network = {}
-
         try:
-            container = await self.__docker_client.containers.create(
-                name=container_name,
-                config={
-                    "Image": container_configuration.image,
-                    "Env": container_configuration.environment,
-                    "HostConfig": {
-                        "Binds": container_configuration.volumes,
-                        "AutoRemove": True
-                    },
-                    "NetworkingConfig": {
-                        "EndpointsConfig": first_network
-                    }
-                }
-            )
+            container = await self.__create_aiodocker_container(container_name, container_configuration)
             if not isinstance(container, DockerContainer):
                 LOGGER.warning("Failed to create container: {:s}".format(
                     container_configuration.container_name))
@@ -172,14 +348,15 @@ class ContainerStarter:
 
             # When creating a container, it can only be connected to one network.
             # The other networks have to be connected separately.
-            for other_network_name in container_configuration.networks[1:]:
-                other_network = await self.__docker_client.networks.get(net_specs=other_network_name)
-                await other_network.connect(
-                    config={
-                        "Container": container_name,
-                        "EndpointConfig": {}
-                    }
-                )
+            other_network_names = container_configuration.networks[1:]
+            if other_network_names:
+                other_networks = await self.__get_networks(other_network_names)
+                if other_networks is None:
+                    return None
+                await asyncio.gather(*(
+                    self.__connect_to_network(container_name, other_network)
+                    for other_network in other_networks
+                ))
 
             return container
 
@@ -192,6 +369,91 @@ class ContainerStarter:
             LOGGER.warning("Received {}: {}".format(type(docker_error).__name__, docker_error))
             return None
 
+    async def __create_aiodocker_container(self, container_name: str,
+                                           container_configuration: ContainerConfiguration) -> DockerContainer:
+        """
+        Creates a Docker container using the 'aiodocker' library. The creation is retried once if the connection
+        to the Docker Engine was found to be stale. Since the first request might have created the container
+        before the connection was lost, a name conflict in the retry is accepted if the existing container
+        matches the configuration and has not been started.
+        """
+        try:
+            return await self.__docker_client.containers.create(
+                name=container_name, config=container_configuration.aiodocker_config)
+        except (ClientConnectionError, ServerDisconnectedError) as connection_error:
+            LOGGER.debug("Retrying container creation after stale Docker connection: {}: {}".format(
+                type(connection_error).__name__, connection_error))
+
+        try:
+            return await self.__docker_client.containers.create(
+                name=container_name, config=container_configuration.aiodocker_config)
+        except DockerError as docker_error:
+            if docker_error.status != self.__class__.__HTTP_CONFLICT:
+                raise
+            existing_container = await self.__docker_client.containers.get(container_name)
+            if (existing_container["Config"]["Image"] != container_configuration.image or
+                    existing_container["State"]["Status"] != self.__class__.__CREATED_STATUS):
+                raise
+            LOGGER.debug("Using container {:s} created by the earlier request".format(container_name))
+            return existing_container
+
+    async def __get_networks(self, network_names: Tuple[str, ...]) -> Optional[List[DockerNetwork]]:
+        """
+        Returns the Docker networks with the given names using a single request to the Docker Engine.
+        Returns None, if any of the networks is not found.
+        """
+        # the network list in aiodocker 0.21 does not support filters, but the number of networks is typically small
+        network_list = await _with_stale_retry(self.__docker_client.networks.list)
+        network_ids = {
+            network_info.get("Name", None): network_info.get("Id", None)
+            for network_info in network_list
+        }
+
+        missing_networks = [
+            network_name
+            for network_name in network_names
+            if network_ids.get(network_name, None) is None
+        ]
+        if missing_networks:
+            LOGGER.warning("Could not find Docker networks: {}".format(", ".join(missing_networks)))
+            return None
+
+        return [
+            DockerNetwork(self.__docker_client, network_ids[network_name])
+            for network_name in network_names
+        ]
+
+    @staticmethod
+    async def __connect_to_network(container_name: str, network: DockerNetwork):
+        """
+        Connects the given container to the given Docker network using the 'aiodocker' library.
+        The connection is retried once if the connection to the Docker Engine was found to be stale.
+        Since the first request might have connected the container before the connection was lost,
+        an error in the retry is accepted if the container is already connected to the network.
+        """
+        network_config = {
+            "Container": container_name,
+            "EndpointConfig": {}
+        }
+        try:
+            await network.connect(config=network_config)
+            return
+        except (ClientConnectionError, ServerDisconnectedError) as connection_error:
+            LOGGER.debug("Retrying network connection after stale Docker connection: {}: {}".format(
+                type(connection_error).__name__, connection_error))
+
+        try:
+            await network.connect(config=network_config)
+        except DockerError:
+            network_info = await network.show()
+            connected_containers = network_info.get("Containers", None) or {}
+            if not any(
+                    container_info.get("Name", None) == container_name
+                    for container_info in connected_containers.values()):
+                raise
+            LOGGER.debug("Container {:s} was connected to network {:s} by the earlier request".format(
+                container_name, network.id))
+
     async def _create_container_backup(self, container_name: str, container_configuration: ContainerConfiguration) \
             -> Optional[Container]:
         """
@@ -204,13 +466,14 @@ class ContainerStarter:
             first_network = container_configuration.networks[0]
 
         try:
-            if self.__docker_client_synchronous is None:
-                self.__docker_client_synchronous = await async_wrap(docker_client_from_env)()
-            container = await async_wrap(self.__docker_client_synchronous.containers.create)(
+            docker_client_synchronous = await get_shared_docker_synchronous()
+            container = await _run_synchronous(
+                docker_client_synchronous.containers.create,
                 name=container_name,
                 image=container_configuration.image,
-                environment=container_configuration.environment,
-                volumes=container_configuration.volumes,
+                environment=list(container_configuration.environment),
+                # the docker library requires the volume bindings as a list
+                volumes=list(container_configuration.volumes),
                 network=first_network,
                 auto_remove=True
             )
@@ -219,12 +482,15 @@ class ContainerStarter:
                     container_configuration.container_name))
                 return None
 
-            other_networks = await async_wrap(self.__docker_client_synchronous.networks.list)(
-                names=container_configuration.networks[1:]
+            other_networks = await _run_synchronous(
+                docker_client_synchronous.networks.list,
+                names=list(container_configuration.networks[1:])
             )
-            for other_network in other_networks:
-                if isinstance(other_network, Network):
-                    await async_wrap(other_network.connect)(container)
+            await asyncio.gather(*(
+                _run_synchronous(other_network.connect, container)
+                for other_network in other_networks
+                if isinstance(other_network, Network)
+            ))
 
             return container
 
@@ -244,12 +510,11 @@ class ContainerStarter:
                 LOGGER.warning("No free simulation indexes. Wait until a simulation run has finished.")
                 return None
 
+            simulation_prefix = self.__class__.__CONTAINER_PREFIX.format(index=simulation_index)
             simulation_containers = []  # type: List[Union[DockerContainer, Container]]
             container_names = []        # type: List[str]
             for container_configuration in simulation_configurations:
-                full_container_name = (
-                    self.__container_prefix.format(index=simulation_index) +
-                    container_configuration.container_name)
+                full_container_name = simulation_prefix + container_configuration.container_name
                 container_names.append(full_container_name)
 
                 new_container = await self.create_container(full_container_name, container_configuration)
@@ -257,19 +522,22 @@ class ContainerStarter:
                     # clean the already created containers
                     LOGGER.warning("Removing containers that have been created.")
 
-                    for container_name, created_container in zip(container_names, simulation_containers):
-                        LOGGER.warning("Removing container: {}".format(container_name))
-                        if isinstance(created_container, DockerContainer):
-                            # remove container created with aiodocker library
-                            await created_container.delete()
-                        elif isinstance(created_container, Container):
-                            # remove container created with docker library
-                            await async_wrap(created_container.remove)()
-                        else:
-                            LOGGER.error("An unknown container type, {}, for container: {}".format(
-                                type(created_container).__name__, container_name))
+                    # one failed removal should not prevent the removal of the other containers
+                    removal_results = await asyncio.gather(
+                        *(
+                            self.__remove_container(container_name, created_container)
+                            for container_name, created_container in zip(container_names, simulation_containers)
+                        ),
+                        return_exceptions=True
+                    )
+                    for container_name, removal_result in zip(container_names, removal_results):
+                        if isinstance(removal_result, BaseException):
+                            LOGGER.error("Could not remove container {}: {}: {}".format(
+                                container_name, type(removal_result).__name__, removal_result))
 
                     # return None to indicate that there was a problem in the container creation
+                    # the next call checks the used indexes from the Docker Engine,
+                    # for example, after a name conflict the index is still in use
                     return None
 
                 # add the newly created container to the container list
@@ -278,18 +546,62 @@ class ContainerStarter:
             # start the created containers
             for container_name, container in zip(container_names, simulation_containers):
                 LOGGER.info("Starting container: {:s}".format(container_name))
-                if inspect.iscoroutinefunction(container.start):
-                    start_function = container.start
+                if isinstance(container, DockerContainer):
+                    # container created with aiodocker library
+                    await container.start()
                 else:
-                    start_function = async_wrap(container.start)
-                await start_function()
+                    # container created with docker library
+                    await _run_synchronous(container.start)
 
             return container_names
 
+    @staticmethod
+    async def __remove_container(container_name: str, container: Union[DockerContainer, Container]):
+        """Removes the given created container."""
+        LOGGER.warning("Removing container: {}".format(container_name))
+        if isinstance(container, DockerContainer):
+            # remove container created with aiodocker library
+            await container.delete()
+        elif isinstance(container, Container):
+            # remove container created with docker library
+            await _run_synchronous(container.remove)
+        else:
+            LOGGER.error("An unknown container type, {}, for container: {}".format(
+                type(container).__name__, container_name))
+
     async def stop_containers(self, container_names: List[str]):
         """Stops all the Docker containers in the given container name list."""
-        # TODO: implement stop_containers
+        stopped_names = set(container_names)
+        await self.__stop_simulation_containers(
+            lambda container_name: container_name in stopped_names)
 
     async def stop_all_simulation_containers(self):
         """Stops all the Docker containers that have been started."""
-        # TODO: implement stop_all_simulation_containers
+        await self.__stop_simulation_containers(lambda container_name: True)
+
+    async def __stop_simulation_containers(self, stop_check: Callable[[str], bool]):
+        """Stops the running simulation containers whose names pass the given check."""
+        async with self.__lock:
+            running_containers = cast(
+                List[DockerContainer],
+                await _with_stale_retry(self.__docker_client.containers.list, filters=self.__class__.__NAME_FILTER))
+
+            stopped_containers = [
+                container
+                for container in running_containers
+                if self.__get_simulation_index(get_container_name(container)) is not None and
+                stop_check(get_container_name(container))
+            ]
+
+            # the containers are stopped concurrently and one failure does not prevent stopping the others
+            stop_results = await asyncio.gather(
+                *(_with_stale_retry(container.stop) for container in stopped_containers),
+                return_exceptions=True
+            )
+            for container, stop_result in zip(stopped_containers, stop_results):
+                container_name = get_container_name(container)
+                if isinstance(stop_result, BaseException):
+                    LOGGER.warning("Could not stop container {}: {}: {}".format(
+                        container_name, type(stop_result).__name__, stop_result))
+                else:
+                    LOGGER.info("Stopped container: {:s}".format(container_name))
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Tampere University and VTT Technical Research Centre of Finland
+# This software was developed as a part of the ProCemPlus project: https://www.senecc.fi/projects/procemplus
+# This source code is licensed under the MIT license. See LICENSE in the repository root directory.
+# Author(s): Ville Heikkilä <ville.heikkila@tuni.fi>
+
+"""
+This module contains a file based cache for the parsed contents of the component manifest files.
+"""
+
+import json
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, Optional, Set
+
+from tools.tools import FullLogger
+
+LOGGER = FullLogger(__name__)
+
+CACHE_MODIFICATION_TIME = "ModificationTime"
+CACHE_FILE_SIZE = "Size"
+CACHE_CONTENT = "Content"
+CACHE_FILE_PERMISSIONS = 0o644
+
+
+class ManifestCache:
+    """
+    Class for holding the parsed contents of manifest files so that unchanged files do not have to be parsed again.
+    The cached contents are identified by the filename, the modification time and the size of the manifest file.
+    The cache is stored in a JSON file, so only contents that can be represented in JSON are cached.
+    """
+    def __init__(self, cache_filename: Optional[pathlib.Path]):
+        """
+        Loads the cache from the given file. If cache_filename is None, the cache is kept only in memory.
+        """
+        self.__cache_filename = cache_filename
+        self.__cache = {}  # type: Dict[str, Dict[str, Any]]
+        # the files that have been used during this run, only these are kept when the cache is saved
+        self.__used_filenames = set()  # type: Set[str]
+        self.__is_modified = False
+
+        if self.__cache_filename is not None and self.__cache_filename.is_file():
+            try:
+                with open(self.__cache_filename, mode="r", encoding="UTF-8") as cache_file:
+                    cache_content = json.load(cache_file)
+                if isinstance(cache_content, dict):
+                    self.__cache = cache_content
+
+            except (OSError, ValueError) as error:
+                LOGGER.warning("Could not load the manifest cache from '%s': %s: %s",
+                               self.__cache_filename, type(error).__name__, error)
+
+    def get(self, filename: str, file_stat: os.stat_result) -> Optional[Any]:
+        """Returns the cached content for the given file or None if the file is not in the cache or has changed."""
+        cache_entry = self.__cache.get(filename, None)
+        if (not isinstance(cache_entry, dict) or
+                cache_entry.get(CACHE_MODIFICATION_TIME, None) != file_stat.st_mtime_ns or
+                cache_entry.get(CACHE_FILE_SIZE, None) != file_stat.st_size):
+            return None
+
+        self.__used_filenames.add(filename)
+        return cache_entry.get(CACHE_CONTENT, None)
+
+    def set(self, filename: str, file_stat: os.stat_result, content: Any):
+        """Adds the given content for the given file to the cache."""
+        try:
+            # check that the content is unchanged when it is stored to the cache file and read back
+            # for example, non-string dictionary keys would be converted to strings
+            is_cacheable = json.loads(json.dumps(content)) == content
+        except (TypeError, ValueError):
+            is_cacheable = False
+        if not is_cacheable:
+            LOGGER.debug("The content from '%s' cannot be cached.", filename)
+            return
+
+        self.__cache[filename] = {
+            CACHE_MODIFICATION_TIME: file_stat.st_mtime_ns,
+            CACHE_FILE_SIZE: file_stat.st_size,
+            CACHE_CONTENT: content
+        }
+        self.__used_filenames.add(filename)
+        self.__is_modified = True
+
+    def save(self):
+        """
+        Writes the cache to the cache file if there are any changes.
+        The entries for the files that have not been used during this run are removed.
+        The cache is first written to a temporary file that then replaces the cache file, so that
+        a concurrent run or an interrupted write does not leave a partially written cache file.
+        """
+        if len(self.__used_filenames) < len(self.__cache):
+            self.__cache = {
+                filename: cache_entry
+                for filename, cache_entry in self.__cache.items()
+                if filename in self.__used_filenames
+            }
+            self.__is_modified = True
+
+        if self.__cache_filename is None or not self.__is_modified:
+            return
+
+        temporary_filename = None  # type: Optional[str]
+        try:
+            file_descriptor, temporary_filename = tempfile.mkstemp(
+                dir=self.__cache_filename.parent, prefix=self.__cache_filename.name + ".", suffix=".tmp")
+            with open(file_descriptor, mode="w", encoding="UTF-8") as cache_file:
+                # the temporary file is created readable only by the owner, use the permissions of a normal file
+                os.chmod(temporary_filename, CACHE_FILE_PERMISSIONS)
+                json.dump(self.__cache, cache_file)
+            os.replace(temporary_filename, self.__cache_filename)
+            self.__is_modified = False
+
+        except OSError as error:
+            LOGGER.warning("Could not save the manifest cache to '%s': %s: %s",
+                           self.__cache_filename, type(error).__name__, error)
+            if temporary_filename is not None and os.path.exists(temporary_filename):
+                try:
+                    os.remove(temporary_filename)
+                except OSError:
+                    pass
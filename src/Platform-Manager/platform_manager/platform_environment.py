@@ -8,10 +8,16 @@
    a simulation using the simulation platform.
 """
 
+import collections
+import concurrent.futures
+import functools
 import logging
 import json
+import os
 import pathlib
-from typing import Any, cast, Dict, List, Optional
+from typing import Any, cast, Dict, List, Optional, Tuple
+
+import yaml
 
 from tools.clients import default_env_variable_definitions as default_rabbitmq_definitions
 from tools.components import (
@@ -21,22 +27,25 @@ from tools.components import (
 from tools.db_clients import default_env_variable_definitions as default_mongodb_definitions
 from tools.datetime_tools import get_utcnow_in_milliseconds
 from tools.tools import (
-    FullLogger, load_environmental_variables, EnvironmentVariable, EnvironmentVariableValue,
+    FullLogger, load_environmental_variables, EnvironmentVariable, EnvironmentVariableType, EnvironmentVariableValue,
     SIMULATION_LOG_LEVEL, SIMULATION_LOG_FILE, SIMULATION_LOG_FORMAT, DEFAULT_LOGFILE_NAME, DEFAULT_LOGFILE_FORMAT)
 
 from platform_manager.component import (
     EXTERNAL_COMPONENT_TYPE, ComponentParameters, ComponentCollectionParameters,
-    get_component_type_parameters, load_component_parameters_from_yaml,
+    get_component_type_parameters, get_component_parameters_from_definition, read_component_type_definition,
     COMPONENT_TYPE_SIMULATION_MANAGER, COMPONENT_TYPE_LOG_WRITER)
 from platform_manager.docker_runner import ContainerConfiguration
+from platform_manager.manifest_cache import ManifestCache
 from platform_manager.simulation import (
     SimulationConfiguration, SimulationComponentConfiguration,
-    DUPLICATE_CONTAINER_NAME_SEPARATOR, SIMULATION_MANAGER_NAME)
+    SIMULATION_MANAGER_NAME, get_instance_names)
 
 LOGGER = FullLogger(__name__)
 
 TIMEOUT = 5.0
 MANIFEST_FILE_EXTENSIONS = (".yml", ".yaml")
+# the maximum number of threads used for reading the manifest files
+MANIFEST_READER_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # The files in each folder under the manifest folder is gone through in an unspecified order.
 # Only the first specification for each component type is taken into account.
@@ -53,6 +62,7 @@ RABBITMQ_EXCHANGE_PREFIX = "RABBITMQ_EXCHANGE_PREFIX"
 MONGODB_APPNAME = "MONGODB_APPNAME"
 
 MANIFEST_FOLDER = "MANIFEST_FOLDER"
+MANIFEST_CACHE_FILE = "MANIFEST_CACHE_FILE"
 START_MESSAGE_FOLDER = "START_MESSAGE_FOLDER"
 
 DOCKER_NETWORK_MONGODB = "DOCKER_NETWORK_MONGODB"
@@ -76,22 +86,55 @@ START_MESSAGE_PROCESS_PARAMETERS = "ProcessParameters"
 # The filename for a stored Start message
 START_MESSAGE_FILENAME_TEMPLATE = "start_message_{simulation_exchange:}.json"
 
+# The translation table for converting a simulation id to a part of the simulation specific exchange name
+SIMULATION_EXCHANGE_TRANSLATION = str.maketrans({"-": "", ":": "", "Z": "", "T": "-", ".": "-"})
+
+
+@functools.lru_cache(maxsize=None)
+def _env(name: str, type_: EnvironmentVariableType,
+         default: EnvironmentVariableValue) -> Optional[EnvironmentVariableValue]:
+    """Returns the value of the given environment variable. The value is read only once per process."""
+    return EnvironmentVariable(name, type_, default).value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env(*env_variable_definitions: Tuple[Any, ...]) -> Dict[str, Optional[EnvironmentVariableValue]]:
+    """
+    Returns the values for the given environment variable definitions. The values are read only once per process,
+    so the returned dictionary is shared and must not be modified.
+    """
+    return load_environmental_variables(*env_variable_definitions)
+
+
+def _load_rabbitmq_env() -> Dict[str, Optional[EnvironmentVariableValue]]:
+    """Returns the RabbitMQ parameters without the exchange name which is decided when starting a new simulation."""
+    return {
+        variable_name: variable_value
+        for variable_name, variable_value in _load_env(*default_rabbitmq_definitions()).items()
+        if variable_name != RABBITMQ_EXCHANGE
+    }
+
 
-# This helper function is a copy from fetch/fetch.py
+# This helper function is based on the one in fetch/fetch.py, but it tries to create the target folder first
 def create_folder(target_folder: pathlib.Path):
-    """Creates the target folder if it does not exist yet."""
+    """
+    Creates the target folder if it does not exist yet.
+    The missing parent folders are also created and all the created folders get read-write access for all users.
+    """
     try:
-        if target_folder.exists():
-            if not target_folder.is_dir():
+        try:
+            os.mkdir(target_folder)
+        except FileNotFoundError:
+            # some of the parent folders do not exist either, they are created with the same permissions
+            create_folder(pathlib.Path(os.path.abspath(target_folder)).parent)
+            os.mkdir(target_folder)
+        except FileExistsError:
+            if not os.path.isdir(target_folder):
                 LOGGER.warning("'{}' is not a directory".format(target_folder))
             return
 
-        resolved_target = target_folder.resolve()
-        if resolved_target.parent != resolved_target and not resolved_target.parent.is_dir():
-            create_folder(resolved_target.parent)
-        resolved_target.mkdir()
         # change the permission to allow read-write access to the folder for all users
-        resolved_target.chmod(0o777)
+        os.chmod(target_folder, 0o777)
 
     except OSError as os_error:
         LOGGER.error("Received '{}' while creating folder '{}': {}".format(
@@ -106,22 +149,27 @@ class PlatformEnvironment:
         # TODO: add some checks for the parameters
 
         # setup the RabbitMQ parameters for the simulation specific exchange
-        rabbitmq_env_variables = load_environmental_variables(*default_rabbitmq_definitions())
-        # the exchange name is decided when starting a new simulation
-        rabbitmq_env_variables.pop(RABBITMQ_EXCHANGE, None)
         self.__rabbitmq = {
-            **rabbitmq_env_variables,
+            **_load_rabbitmq_env(),
             RABBITMQ_EXCHANGE_AUTODELETE: True,
             RABBITMQ_EXCHANGE_DURABLE: False
         }
-        self.__rabbitmq_exchange_prefix = cast(
-            str, EnvironmentVariable(RABBITMQ_EXCHANGE_PREFIX, str, "procem.").value)
-
-        # setup the MongoDB parameters for components needing database access
-        self.__mongodb = load_environmental_variables(*default_mongodb_definitions())
+        self.__rabbitmq_exchange_prefix = cast(str, _env(RABBITMQ_EXCHANGE_PREFIX, str, "procem."))
+        # the exchange names and the Start message filenames are the same for all components in a simulation
+        self.__simulation_exchange_names = {}  # type: Dict[str, str]
+        self.__start_message_filenames = {}  # type: Dict[str, pathlib.Path]
+
+        # the MongoDB parameters, the Docker parameters and the supported component types are loaded on first use
+        self.__mongodb_parameters = None  # type: Optional[Dict[str, Optional[EnvironmentVariableValue]]]
+        self.__docker_parameters = None  # type: Optional[Dict[str, Optional[EnvironmentVariableValue]]]
+        # the Docker networks and volumes for each combination of the get_docker_networks/volumes arguments
+        self.__docker_networks = {}  # type: Dict[Tuple[bool, bool], Tuple[str, ...]]
+        self.__docker_volumes = {}  # type: Dict[Tuple[bool, bool], Tuple[str, ...]]
+        self.__component_collection = None  # type: Optional[ComponentCollectionParameters]
+        self.__manifest_folder = pathlib.Path(cast(str, _env(MANIFEST_FOLDER, str, "/manifests")))
 
         # setup the common parameters used by all simulation components
-        self.__common = load_environmental_variables(
+        self.__common = _load_env(
             (SIMULATION_LOG_LEVEL, int, logging.DEBUG),
             (SIMULATION_LOG_FILE, str, DEFAULT_LOGFILE_NAME),
             (SIMULATION_LOG_FORMAT, str, DEFAULT_LOGFILE_FORMAT),
@@ -130,30 +178,59 @@ class PlatformEnvironment:
             (SIMULATION_STATUS_MESSAGE_TOPIC, str, "Status.Ready"),
             (SIMULATION_ERROR_MESSAGE_TOPIC, str, "Status.Error")
         )
-
-        # load the component type definitions from the component manifest files
-        self.__supported_component_types = ComponentCollectionParameters()
-        self.__manifest_folder = pathlib.Path(cast(str, EnvironmentVariable(MANIFEST_FOLDER, str, "/manifests").value))
-        self.__read_manifest_folder(self.__manifest_folder)
-
-        self.__start_message_folder = pathlib.Path(
-            cast(str, EnvironmentVariable(START_MESSAGE_FOLDER, str, "/logs/start").value)
-        )
-        create_folder(self.__start_message_folder)
-
-        # load the Docker network and volume related variables
-        self.__docker = load_environmental_variables(
-            (DOCKER_NETWORK_MONGODB, str),
-            (DOCKER_NETWORK_RABBITMQ, str),
-            (DOCKER_NETWORK_PLATFORM, str, ""),
-            (DOCKER_VOLUME_NAME_RESOURCES, str),
-            (DOCKER_VOLUME_NAME_LOGS, str),
-            (DOCKER_VOLUME_TARGET_RESOURCES, str, ""),
-            (DOCKER_VOLUME_TARGET_LOGS, str, "")
-        )
+        # the component log filenames are formed by adding the component name before the file extension
+        log_filename_stem, separator, log_filename_extension = \
+            cast(str, self.__common[SIMULATION_LOG_FILE]).rpartition(".")
+        if separator:
+            self.__log_filename_parts = (log_filename_stem + "_", separator + log_filename_extension)
+        else:
+            # rpartition returns the whole filename as the last item when there is no separator
+            self.__log_filename_parts = (log_filename_extension + "_", "")
+
+        self.__start_message_folder = pathlib.Path(cast(str, _env(START_MESSAGE_FOLDER, str, "/logs/start")))
+        # the folder for the Start messages is created when the first Start message is stored
+        self.__start_message_folder_ready = False
+
+    @property
+    def __mongodb(self) -> Dict[str, Optional[EnvironmentVariableValue]]:
+        """The MongoDB parameters for components needing database access."""
+        if self.__mongodb_parameters is None:
+            self.__mongodb_parameters = _load_env(*default_mongodb_definitions())
+        return self.__mongodb_parameters
+
+    @property
+    def __docker(self) -> Dict[str, Optional[EnvironmentVariableValue]]:
+        """The Docker network and volume related parameters."""
+        if self.__docker_parameters is None:
+            self.__docker_parameters = _load_env(
+                (DOCKER_NETWORK_MONGODB, str),
+                (DOCKER_NETWORK_RABBITMQ, str),
+                (DOCKER_NETWORK_PLATFORM, str, ""),
+                (DOCKER_VOLUME_NAME_RESOURCES, str),
+                (DOCKER_VOLUME_NAME_LOGS, str),
+                (DOCKER_VOLUME_TARGET_RESOURCES, str, ""),
+                (DOCKER_VOLUME_TARGET_LOGS, str, "")
+            )
+        return self.__docker_parameters
+
+    @property
+    def __supported_component_types(self) -> ComponentCollectionParameters:
+        """The supported component types. The component manifest files are read on first use."""
+        if self.__component_collection is None:
+            self.__component_collection = ComponentCollectionParameters()
+            # the parsed manifest files are cached between runs, an empty filename disables the cache file
+            manifest_cache_filename = cast(str, _env(MANIFEST_CACHE_FILE, str, "/logs/manifest_cache.json"))
+            manifest_cache = ManifestCache(
+                pathlib.Path(manifest_cache_filename) if manifest_cache_filename else None)
+            self.__read_manifest_folder(self.__component_collection, self.__manifest_folder, manifest_cache)
+            manifest_cache.save()
+        return self.__component_collection
 
     def get_rabbitmq_parameters(self, simulation_id: str) -> Dict[str, EnvironmentVariableValue]:
-        """The simulation specific parameters for a RabbitMQ connection."""
+        """
+        The simulation specific parameters for a RabbitMQ connection.
+        A new dictionary is returned at each call, so the caller is allowed to modify it.
+        """
         return {
             **self.__rabbitmq,
             RABBITMQ_EXCHANGE: self.get_simulation_exchange_name(simulation_id)
@@ -161,29 +238,30 @@ class PlatformEnvironment:
 
     def get_simulation_exchange_name(self, simulation_id: str) -> str:
         """Returns the name for the simulation specific exchange."""
-        return (
-            self.__rabbitmq_exchange_prefix +
-            simulation_id.replace("-", "").replace(":", "").replace("Z", "").replace("T", "-").replace(".", "-")
-        )
+        simulation_exchange = self.__simulation_exchange_names.get(simulation_id, None)
+        if simulation_exchange is None:
+            simulation_exchange = (
+                self.__rabbitmq_exchange_prefix + simulation_id.translate(SIMULATION_EXCHANGE_TRANSLATION))
+            self.__simulation_exchange_names[simulation_id] = simulation_exchange
+        return simulation_exchange
 
     def get_component_log_filename(self, component_name: str) -> str:
         """Returns the log filename for the given component."""
-        filename_addition = "_" + component_name
-        main_log_filename = cast(str, self.__common[SIMULATION_LOG_FILE])
-        identifier_start = main_log_filename.rfind(".")
-
-        if identifier_start == -1:
-            return main_log_filename + filename_addition
-        return main_log_filename[:identifier_start] + filename_addition + main_log_filename[identifier_start:]
+        filename_prefix, filename_suffix = self.__log_filename_parts
+        return filename_prefix + component_name + filename_suffix
 
     def get_docker_networks(self, rabbitmq: bool = True, mongodb: bool = False) -> List[str]:
         """Returns the names of the asked Docker networks."""
-        docker_networks = [cast(str, self.__docker[DOCKER_NETWORK_PLATFORM])]
-        if rabbitmq and self.__docker[DOCKER_NETWORK_RABBITMQ]:
-            docker_networks.append(cast(str, self.__docker[DOCKER_NETWORK_RABBITMQ]))
-        if mongodb and self.__docker[DOCKER_NETWORK_MONGODB]:
-            docker_networks.append(cast(str, self.__docker[DOCKER_NETWORK_MONGODB]))
-        return docker_networks
+        docker_networks = self.__docker_networks.get((rabbitmq, mongodb), None)
+        if docker_networks is None:
+            docker_network_list = [cast(str, self.__docker[DOCKER_NETWORK_PLATFORM])]
+            if rabbitmq and self.__docker[DOCKER_NETWORK_RABBITMQ]:
+                docker_network_list.append(cast(str, self.__docker[DOCKER_NETWORK_RABBITMQ]))
+            if mongodb and self.__docker[DOCKER_NETWORK_MONGODB]:
+                docker_network_list.append(cast(str, self.__docker[DOCKER_NETWORK_MONGODB]))
+            docker_networks = tuple(docker_network_list)
+            self.__docker_networks[(rabbitmq, mongodb)] = docker_networks
+        return list(docker_networks)
 
     def get_docker_volumes(self, resources: bool = True, logs: bool = True) -> List[str]:
         """
@@ -191,47 +269,54 @@ class PlatformEnvironment:
         Resources volume is used for static files and logs volume is used for log output.
         The format for the binding values are: <volume_name>:<folder_name>[:<rw|ro>]
         """
-        docker_volumes = []
-        if resources and self.__docker[DOCKER_VOLUME_NAME_RESOURCES]:
-            docker_volumes.append(":".join([
-                cast(str, self.__docker[DOCKER_VOLUME_NAME_RESOURCES]),
-                cast(str, self.__docker[DOCKER_VOLUME_TARGET_RESOURCES])
-            ]))
-        if logs and self.__docker[DOCKER_VOLUME_NAME_LOGS]:
-            docker_volumes.append(":".join([
-                cast(str, self.__docker[DOCKER_VOLUME_NAME_LOGS]),
-                cast(str, self.__docker[DOCKER_VOLUME_TARGET_LOGS])
-            ]))
-        return docker_volumes
+        docker_volumes = self.__docker_volumes.get((resources, logs), None)
+        if docker_volumes is None:
+            docker_volume_list = []
+            if resources and self.__docker[DOCKER_VOLUME_NAME_RESOURCES]:
+                docker_volume_list.append(":".join([
+                    cast(str, self.__docker[DOCKER_VOLUME_NAME_RESOURCES]),
+                    cast(str, self.__docker[DOCKER_VOLUME_TARGET_RESOURCES])
+                ]))
+            if logs and self.__docker[DOCKER_VOLUME_NAME_LOGS]:
+                docker_volume_list.append(":".join([
+                    cast(str, self.__docker[DOCKER_VOLUME_NAME_LOGS]),
+                    cast(str, self.__docker[DOCKER_VOLUME_TARGET_LOGS])
+                ]))
+            docker_volumes = tuple(docker_volume_list)
+            self.__docker_volumes[(resources, logs)] = docker_volumes
+        return list(docker_volumes)
 
     def get_start_message_variables(self, component_type: str, component_attributes: SimulationComponentConfiguration) \
             -> Optional[Dict[str, Any]]:
         """Returns the process parameter block for the Start message for the given component type."""
         component_type_parameters = self.__supported_component_types.component_types.get(component_type, None)
         if component_type_parameters is None:
-            LOGGER.warning("Component type '{}' is not supported".format(component_type))
+            LOGGER.warning("Component type '%s' is not supported", component_type)
             return None
 
+        type_attributes = component_type_parameters.attributes
+        given_attributes = component_attributes.attributes
+
         variables = {}
         # go through all the attributes found in the simulation run specification
-        for attribute_name, attribute_value in component_attributes.attributes.items():
-            if (attribute_name not in component_type_parameters.attributes or
-                    component_type_parameters.attributes[attribute_name].include_in_start):
+        for attribute_name, attribute_value in given_attributes.items():
+            attribute_settings = type_attributes.get(attribute_name, None)
+            if attribute_settings is None or attribute_settings.include_in_start:
                 variables[attribute_name] = attribute_value
 
         # go through all the attributes registered for the component type
-        for attribute_name, attribute_settings in component_type_parameters.attributes.items():
-            if attribute_settings.include_in_start and attribute_name not in component_attributes.attributes:
+        # the manifest order is kept here since it determines the attribute order in the stored Start message
+        for attribute_name, attribute_settings in type_attributes.items():
+            if attribute_settings.include_in_start and attribute_name not in given_attributes:
                 if attribute_settings.optional and attribute_settings.default is not None:
                     variables[attribute_name] = attribute_settings.default
                 elif attribute_settings.optional:
                     LOGGER.warning(
-                        "Optional attribute '{}' for component '{}' ".format(attribute_name, component_type) +
-                        " does not have a default value and it is not set")
+                        "Optional attribute '%s' for component '%s' does not have a default value and it is not set",
+                        attribute_name, component_type)
                 else:
-                    LOGGER.warning("Required attribute '{}' not given for component type '{}'".format(
-                        attribute_name, component_type
-                    ))
+                    LOGGER.warning("Required attribute '%s' not given for component type '%s'",
+                                   attribute_name, component_type)
                     return None
 
         return variables
@@ -240,21 +325,20 @@ class PlatformEnvironment:
                                component_name: str) -> Dict[str, EnvironmentVariableValue]:
         """Returns the environment variables for a normal simulation component with the given component name.
            Does not include the parameters set in the simulation configuration file."""
-        env_variables = {}
+        # get_rabbitmq_parameters returns a new dictionary, so it can be used as the base for the other variables
         if component_parameters.include_rabbitmq_parameters:
             env_variables = self.get_rabbitmq_parameters(simulation_id)
+        else:
+            env_variables = {}
         if component_parameters.include_mongodb_parameters:
-            env_variables = {**env_variables, **self.__mongodb}
+            env_variables.update(self.__mongodb)
         if component_parameters.include_general_parameters:
-            env_variables = {
-                **env_variables,
-                **self.__common,
-                SIMULATION_ID: simulation_id,
-                SIMULATION_COMPONENT_NAME: component_name,
-                SIMULATION_LOG_FILE: self.get_component_log_filename(component_name),
-                SIMULATION_START_MESSAGE_FILENAME: str(self.get_start_message_filename(
-                    self.get_simulation_exchange_name(simulation_id)))
-            }
+            env_variables.update(self.__common)
+            env_variables[SIMULATION_ID] = simulation_id
+            env_variables[SIMULATION_COMPONENT_NAME] = component_name
+            env_variables[SIMULATION_LOG_FILE] = self.get_component_log_filename(component_name)
+            env_variables[SIMULATION_START_MESSAGE_FILENAME] = str(self.get_start_message_filename(
+                self.get_simulation_exchange_name(simulation_id)))
         return env_variables  # type: ignore
 
     def get_environmental_variables(self, component_type: str, simulation_id: str, component_name: str,
@@ -263,45 +347,48 @@ class PlatformEnvironment:
         """Returns the environment variables for a simulation component."""
         component_type_parameters = self.__supported_component_types.component_types.get(component_type, None)
         if component_type_parameters is None:
-            LOGGER.warning("Component type '{}' is not supported".format(component_type))
+            LOGGER.warning("Component type '%s' is not supported", component_type)
             return None
 
         # set the base environment variables (RabbitMQ, simulation id, component name, etc.)
         env_variables = self.get_base_env_variables(component_type_parameters, simulation_id, component_name)
 
+        type_attributes = component_type_parameters.attributes
+        given_attributes = component_attributes.attributes
+
         # go through all the attributes found in the simulation run specification
-        for attribute_name, attribute_value in component_attributes.attributes.items():
-            if attribute_name in component_type_parameters.attributes:
-                env_variable_name = component_type_parameters.attributes[attribute_name].environment
-                if env_variable_name is None:
-                    env_variable_name = attribute_name
-            else:
+        for attribute_name, attribute_value in given_attributes.items():
+            attribute_settings = type_attributes.get(attribute_name, None)
+            if attribute_settings is None or attribute_settings.environment is None:
                 env_variable_name = attribute_name
+            else:
+                env_variable_name = attribute_settings.environment
 
             # if the attribute value is a list, concatenate the items to a string using comma as a separator
             if isinstance(attribute_value, list):
-                attribute_value = ",".join([str(attribute_item) for attribute_item in attribute_value])
+                attribute_value = ",".join(map(str, attribute_value))
 
             env_variables[env_variable_name] = attribute_value
 
-        # go through all the attributes registered for the component type
-        for attribute_name, attribute_settings in component_type_parameters.attributes.items():
-            if attribute_name not in component_attributes.attributes:
-                if attribute_settings.optional and attribute_settings.default is not None:
-                    env_variable_name = attribute_settings.environment
-                    if env_variable_name is None:
-                        env_variable_name = attribute_name
-                    env_variables[env_variable_name] = attribute_settings.default
+        # go through the attributes registered for the component type that were not given in the specification
+        # the attributes are handled in the order of the component type definition
+        for attribute_name, attribute_settings in type_attributes.items():
+            if attribute_name in given_attributes:
+                continue
+            if attribute_settings.optional and attribute_settings.default is not None:
+                env_variable_name = attribute_settings.environment
+                if env_variable_name is None:
+                    env_variable_name = attribute_name
+                env_variables[env_variable_name] = attribute_settings.default
 
-                elif attribute_settings.optional:
-                    LOGGER.warning(
-                        "Optional attribute '{}' for component '{}' ".format(attribute_name, component_type) +
-                        " does not have a default value and it is not set")
-                else:
-                    LOGGER.warning("Required attribute '{}' not given for component type '{}'".format(
-                        attribute_name, component_type
-                    ))
-                    return None
+            elif attribute_settings.optional:
+                LOGGER.warning(
+                    "Optional attribute '%s' for component '%s' does not have a default value and it is not set",
+                    attribute_name, component_type)
+            else:
+                LOGGER.warning("Required attribute '%s' not given for component type '%s'",
+                               attribute_name, component_type)
+                return None
 
         return env_variables
 
@@ -309,32 +396,44 @@ class PlatformEnvironment:
             Optional[List[ContainerConfiguration]]:
         """Returns a list containing the Docker container configurations for a new simulation run."""
         container_configurations = []
+        component_types = self.__supported_component_types.component_types
 
         for component_type in ([COMPONENT_TYPE_LOG_WRITER] +
                                list(simulation_configuration.components) +
                                [COMPONENT_TYPE_SIMULATION_MANAGER]):
-            if component_type not in self.__supported_component_types.component_types:
+            try:
+                component_type_settings = component_types[component_type]
+            except KeyError:
                 LOGGER.error("Encountered unsupported component type: {}".format(component_type))
                 return None
 
-            component_type_settings = self.__supported_component_types.component_types[component_type]
             if component_type_settings.component_type == EXTERNAL_COMPONENT_TYPE:
                 # No Docker containers are created for static components
                 continue
 
-            component_instance_dictionary = self.__get_component_processes(component_type, simulation_configuration)
+            component_instance_dictionary = self.__get_component_processes(
+                component_type, component_type_settings, simulation_configuration)
             if component_instance_dictionary is None:
                 LOGGER.error("Encountered unknown core component type: {}".format(component_type))
                 return None
 
+            # The Docker image and networks are the same for all instances of the component type.
+            docker_image = (
+                "unknown" if component_type_settings.docker_image is None
+                else component_type_settings.docker_image.full_name
+            )
+            docker_networks = self.get_docker_networks(
+                rabbitmq=component_type_settings.include_rabbitmq_parameters,
+                mongodb=component_type_settings.include_mongodb_parameters
+            )
+
             # Go through each instance for each of the dynamic component type.
             for component_name, component_configuration in component_instance_dictionary.items():
-                for index in range(1, component_configuration.duplication_count + 1):
-                    if component_configuration.duplication_count == 1:
-                        full_component_name = component_name
-                    else:
-                        full_component_name = DUPLICATE_CONTAINER_NAME_SEPARATOR.join([component_name, str(index)])
-
+                docker_volumes = self.get_docker_volumes(
+                    resources=component_name not in (COMPONENT_TYPE_SIMULATION_MANAGER, COMPONENT_TYPE_LOG_WRITER)
+                )
+                for full_component_name in get_instance_names(
+                        component_name, component_configuration.duplication_count):
                     # Create a dictionary of the environmental variables for this current component instance.
                     environment_variables = self.get_environmental_variables(
                         component_type=component_type,
@@ -350,19 +449,10 @@ class PlatformEnvironment:
                     container_configurations.append(
                         ContainerConfiguration(
                             container_name=full_component_name,
-                            docker_image=(
-                                "unknown" if component_type_settings.docker_image is None
-                                else component_type_settings.docker_image.full_name
-                            ),
+                            docker_image=docker_image,
                             environment=environment_variables,
-                            networks=self.get_docker_networks(
-                                rabbitmq=component_type_settings.include_rabbitmq_parameters,
-                                mongodb=component_type_settings.include_mongodb_parameters
-                            ),
-                            volumes=self.get_docker_volumes(
-                                resources=component_name not in (
-                                    COMPONENT_TYPE_SIMULATION_MANAGER, COMPONENT_TYPE_LOG_WRITER)
-                            )
+                            networks=docker_networks,
+                            volumes=docker_volumes
                         )
                     )
 
@@ -393,8 +483,9 @@ class PlatformEnvironment:
             }
         }
 
+        component_types = self.__supported_component_types.component_types
         for component_type, component_instances in simulation_configuration.components.items():
-            if component_type not in self.__supported_component_types.component_types:
+            if component_type not in component_types:
                 LOGGER.error("Encountered unsupported component type: {}".format(component_type))
                 return None
 
@@ -403,12 +494,7 @@ class PlatformEnvironment:
             start_message_component_type = start_message[START_MESSAGE_PROCESS_PARAMETERS][component_type]
 
             for process_name, process_parameters in component_instances.processes.items():
-                for index in range(1, process_parameters.duplication_count + 1):
-                    if process_parameters.duplication_count == 1:
-                        full_process_name = process_name
-                    else:
-                        full_process_name = DUPLICATE_CONTAINER_NAME_SEPARATOR.join([process_name, str(index)])
-
+                for full_process_name in get_instance_names(process_name, process_parameters.duplication_count):
                     start_message_component_type[full_process_name] = self.get_start_message_variables(
                         component_type=component_type,
                         component_attributes=process_parameters
@@ -419,13 +505,18 @@ class PlatformEnvironment:
     def store_start_message(self, start_message: Dict[str, Any]) -> bool:
         """Stores the given Start message to a file."""
         try:
-            # at this point it is assumed that the target folder exists and is writable
-            # also, it is assumed that the given message is a valid Start message
+            # it is assumed that the given message is a valid Start message
             simulation_exchange = start_message.get(START_MESSAGE_SIMULATION_SPECIFIC_EXCHANGE, None)
             if not isinstance(simulation_exchange, str):
                 LOGGER.error("No simulation specific exchange found in the Start message")
                 return False
 
+            if not self.__start_message_folder_ready:
+                # after this it is assumed that the target folder exists and is writable
+                create_folder(self.__start_message_folder)
+                self.__start_message_folder_ready = True
+
+            # the same json encoding is used as for the sent Start message so that the file content matches it
             start_message_str = json.dumps(start_message, indent=4)
             full_filename = self.get_start_message_filename(cast(str, simulation_exchange))
             with open(full_filename, mode="w", encoding="UTF-8") as start_message_file:
@@ -455,49 +546,129 @@ class PlatformEnvironment:
 
     def get_start_message_filename(self, simulation_exchange: str) -> pathlib.Path:
         """Returns the full filename where the JSON formatted Start message will be stored."""
-        simple_filename = pathlib.Path(START_MESSAGE_FILENAME_TEMPLATE.format(simulation_exchange=simulation_exchange))
-        return self.__start_message_folder / simple_filename
-
-    def __read_manifest_folder(self, manifest_folder: pathlib.Path):
+        full_filename = self.__start_message_filenames.get(simulation_exchange, None)
+        if full_filename is None:
+            full_filename = self.__start_message_folder / START_MESSAGE_FILENAME_TEMPLATE.format(
+                simulation_exchange=simulation_exchange)
+            self.__start_message_filenames[simulation_exchange] = full_filename
+        return full_filename
+
+    def __read_manifest_folder(self, component_collection: ComponentCollectionParameters,
+                               manifest_folder: pathlib.Path, manifest_cache: ManifestCache):
         """
         Iterates through the given folder and parses all found files and
-        adds the defined components to the list of supported component types.
+        adds the defined components to the given collection of supported component types.
+        """
+        manifest_entries = self.__get_manifest_entries(manifest_folder)
+
+        # the cached contents are used for the manifest files that have not been modified
+        file_stats = []  # type: List[Optional[os.stat_result]]
+        component_type_definitions = []  # type: List[Optional[Any]]
+        for manifest_entry in manifest_entries:
+            try:
+                file_stat = manifest_entry.stat()  # type: Optional[os.stat_result]
+            except OSError as file_error:
+                LOGGER.error("Exception '{}' when trying to read manifest file '{}': {}".format(
+                    type(file_error).__name__, manifest_entry.path, file_error))
+                file_stat = None
+            file_stats.append(file_stat)
+            component_type_definitions.append(
+                None if file_stat is None else manifest_cache.get(manifest_entry.path, file_stat))
+
+        # the other manifest files are read and parsed concurrently
+        uncached_indexes = [
+            index
+            for index, (file_stat, component_type_definition) in enumerate(zip(file_stats, component_type_definitions))
+            if file_stat is not None and component_type_definition is None
+        ]
+        uncached_files = [pathlib.Path(manifest_entries[index].path) for index in uncached_indexes]
+        if len(uncached_files) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(MANIFEST_READER_MAX_WORKERS, len(uncached_files))) as executor:
+                parsed_definitions = list(executor.map(self.__parse_manifest_file, uncached_files))
+        else:
+            parsed_definitions = [self.__parse_manifest_file(manifest_file) for manifest_file in uncached_files]
+
+        for index, component_type_definition in zip(uncached_indexes, parsed_definitions):
+            if component_type_definition is not None:
+                component_type_definitions[index] = component_type_definition
+                manifest_cache.set(manifest_entries[index].path, cast(os.stat_result, file_stats[index]),
+                                   component_type_definition)
+
+        # the component types are added in the priority order of the manifest files
+        for manifest_entry, component_type_definition in zip(manifest_entries, component_type_definitions):
+            self.__add_component_type(
+                component_collection, pathlib.Path(manifest_entry.path), component_type_definition)
+
+    @staticmethod
+    def __get_manifest_entries(manifest_folder: pathlib.Path) -> List[os.DirEntry]:
+        """
+        Returns the entries for the manifest files under the given folder in the order of their priority.
+        The folders are gone through depth-first: the files in the current folder are listed first,
+        then the files from the subfolder with the priority name and then the files from the other subfolders.
         """
+        manifest_entries = []  # type: List[os.DirEntry]
+        folder_stack = collections.deque([str(manifest_folder)])
+        while folder_stack:
+            current_folder = folder_stack.pop()
+            try:
+                subfolders = []  # type: List[str]
+                priority_folder = None  # type: Optional[str]
+                with os.scandir(current_folder) as folder_entries:
+                    for folder_entry in folder_entries:
+                        if folder_entry.is_dir():
+                            # iterate through the files in the current folder before any subfolders
+                            if folder_entry.name == MANIFEST_FOLDER_WITH_PRIORITY:
+                                priority_folder = folder_entry.path
+                            else:
+                                subfolders.append(folder_entry.path)
+
+                        elif folder_entry.is_file() and folder_entry.name.endswith(MANIFEST_FILE_EXTENSIONS):
+                            manifest_entries.append(folder_entry)
+
+                # the last folder added to the stack is handled first
+                folder_stack.extend(reversed(subfolders))
+                if priority_folder is not None:
+                    folder_stack.append(priority_folder)
+
+            except OSError as file_error:
+                LOGGER.error("Exception '{}' when trying to read manifest folder '{}': {}".format(
+                    type(file_error).__name__, current_folder, file_error))
+
+        return manifest_entries
+
+    @staticmethod
+    def __parse_manifest_file(manifest_file: pathlib.Path) -> Optional[Any]:
+        """Returns the parsed content of the given manifest file or None if the file could not be parsed."""
         try:
-            subfolders = []  # List[Path]
-            priority_folder = None  # Optional[Path]
-            for manifest_file in manifest_folder.iterdir():
-                if manifest_file.is_dir():
-                    # iterate through the files in the current folder before any subfolders
-                    if manifest_file.parts and manifest_file.parts[-1] == MANIFEST_FOLDER_WITH_PRIORITY:
-                        priority_folder = manifest_file
-                    else:
-                        subfolders.append(manifest_file)
-
-                elif manifest_file.is_file() and manifest_file.suffix in MANIFEST_FILE_EXTENSIONS:
-                    component_definition = load_component_parameters_from_yaml(manifest_file)
-                    if component_definition is not None:
-                        add_check = self.__supported_component_types.add_type(*component_definition, False)
-                        if add_check:
-                            LOGGER.info("Added component type '{}' to supported components".format(
-                                component_definition[0]))
-                            LOGGER.debug("Component '{}' definition: {}".format(*component_definition))
-                        else:
-                            LOGGER.info("Component type '{}' was already registered.".format(component_definition[0]))
-                    else:
-                        LOGGER.warning("No component definition could be parsed from '{}'".format(manifest_file))
-
-            # iterate through the subfolder with priority name before any other subfolders
-            if priority_folder:
-                self.__read_manifest_folder(priority_folder)
-            for subfolder in subfolders:
-                self.__read_manifest_folder(subfolder)
-
-        except OSError as file_error:
-            LOGGER.error("Exception '{}' when trying to read manifest folder '{}': {}".format(
-                type(file_error).__name__, manifest_folder, file_error))
-
-    def __get_component_processes(self, component_type: str, simulation_configuration: SimulationConfiguration) \
+            return read_component_type_definition(manifest_file)
+
+        except (OSError, yaml.YAMLError) as yaml_error:
+            LOGGER.error("Encountered '{}' exception when loading component type definitions from '{}': {}".format(
+                type(yaml_error).__name__, manifest_file, yaml_error
+            ))
+            return None
+
+    @staticmethod
+    def __add_component_type(component_collection: ComponentCollectionParameters, manifest_file: pathlib.Path,
+                             component_type_definition: Optional[Any]):
+        """Adds the component type defined in the given manifest file content to the given collection."""
+        component_definition = (
+            None if component_type_definition is None
+            else get_component_parameters_from_definition(component_type_definition, manifest_file)
+        )
+        if component_definition is not None:
+            add_check = component_collection.add_type(*component_definition, False)
+            if add_check:
+                LOGGER.info("Added component type '%s' to supported components", component_definition[0])
+                LOGGER.debug("Component '%s' definition: %s", *component_definition)
+            else:
+                LOGGER.info("Component type '%s' was already registered.", component_definition[0])
+        else:
+            LOGGER.warning("No component definition could be parsed from '{}'".format(manifest_file))
+
+    def __get_component_processes(self, component_type: str, component_type_settings: ComponentParameters,
+                                  simulation_configuration: SimulationConfiguration) \
             -> Optional[Dict[str, SimulationComponentConfiguration]]:
         """
         Returns a dictionary containing the configuration for the processes for the given component type.
@@ -506,7 +677,6 @@ class PlatformEnvironment:
         instances in the same simulation run. Gathers the component names and configurations first to allow
         uniform creation for the container configuration for both core and domain components.
         """
-        component_type_settings = self.__supported_component_types.component_types[component_type]
         if component_type in (COMPONENT_TYPE_SIMULATION_MANAGER, COMPONENT_TYPE_LOG_WRITER):
             if component_type == COMPONENT_TYPE_SIMULATION_MANAGER:
                 # setup the simulation manager name and the configuration
@@ -11,12 +11,12 @@ a simulation using the simulation platform.
 
 import asyncio
 import json
-from typing import Any, cast, Dict
+from typing import Any, Dict
 
 from tools.clients import RabbitmqClient
-from tools.tools import FullLogger, EnvironmentVariable, log_exception
+from tools.tools import FullLogger, env_str, log_exception
 
-from platform_manager.docker_runner import ContainerStarter
+from platform_manager.docker_runner import ContainerStarter, close_shared_docker_clients
 from platform_manager.platform_environment import PlatformEnvironment
 from platform_manager.simulation import load_simulation_parameters_from_yaml
 
@@ -38,7 +38,7 @@ class PlatformManager:
         # Open the Docker Engine connection.
         self.__container_starter = ContainerStarter()
 
-        self.__start_topic = cast(str, EnvironmentVariable(SIMULATION_START_MESSAGE_TOPIC, str, "Start").value)
+        self.__start_topic = env_str(SIMULATION_START_MESSAGE_TOPIC, "Start")
         self.__is_stopped = False
 
     @property
@@ -51,6 +51,7 @@ class PlatformManager:
         LOGGER.info("Stopping the platform manager.")
         await self.__rabbitmq_client.close()
         await self.__container_starter.close()
+        await close_shared_docker_clients()
         self.__is_stopped = True
 
     def register_component_type(self, component_type: str,
@@ -60,9 +61,9 @@ class PlatformManager:
             component_type, component_type_definition)
 
         if register_check:
-            LOGGER.info("Registered component type: '{}'".format(component_type))
+            LOGGER.info("Registered component type: '%s'", component_type)
         else:
-            LOGGER.warning("Could not register component type: '{}'".format(component_type))
+            LOGGER.warning("Could not register component type: '%s'", component_type)
         return register_check
 
     async def start_simulation(self, simulation_configuration_file: str) -> bool:
@@ -87,32 +88,36 @@ class PlatformManager:
         if start_message is None:
             LOGGER.error("Could not create the Start message.")
             return False
+        try:
+            # the Start message is encoded before the containers are started so that an unserializable
+            # configuration does not leave the simulation containers running without a Start message
+            start_message_bytes = bytes(json.dumps(start_message), encoding="UTF-8")
+        except (TypeError, ValueError) as error:
+            LOGGER.error("Could not encode the Start message: %s: %s", type(error).__name__, error)
+            return False
         start_message_is_stored = self.__platform_environment.store_start_message(start_message)
         if not start_message_is_stored:
             LOGGER.warning("Could not save the Start message to a file.")
 
-        LOGGER.info("Starting the Docker containers for simulation: '{:s}' with id: {:s}".format(
-            simulation_name, simulation_id))
+        LOGGER.info("Starting the Docker containers for simulation: '%s' with id: %s",
+                    simulation_name, simulation_id)
         container_names = await self.__container_starter.start_simulation(container_configuration)
 
         if container_names is None:
             LOGGER.error("A problem starting the simulation. Could not create the Docker containers.")
             return False
 
-        start_message_bytes = bytes(json.dumps(start_message), encoding="UTF-8")
         await self.__rabbitmq_client.send_message(topic_name=self.__start_topic, message_bytes=start_message_bytes)
-        LOGGER.info("Start message for simulation '{:s}' sent to management exchange.".format(simulation_name))
+        LOGGER.info("Start message for simulation '%s' sent to management exchange.", simulation_name)
 
         # The container for the simulation manager should be the last one in the list.
         manager_container_name = container_names[-1]
-        identifier_start_index = len(ContainerStarter.PREFIX_START)
-        identifier_end_index = identifier_start_index + ContainerStarter.PREFIX_DIGITS
-        simulation_identifier = manager_container_name[identifier_start_index:identifier_end_index]
-        LOGGER.info("Simulation '{:s}' started successfully using id: {:s}".format(simulation_name, simulation_id))
-        LOGGER.info("Follow the simulation by using the command:\n" +
-                    "    source follow_simulation.sh {:s}".format(simulation_identifier))
-        LOGGER.info("Alternatively, the simulation manager logs can by viewed by:\n" +
-                    "    docker logs --follow {:s}".format(manager_container_name))
+        simulation_identifier = manager_container_name[ContainerStarter.IDENTIFIER_SLICE]
+        LOGGER.info("Simulation '%s' started successfully using id: %s", simulation_name, simulation_id)
+        LOGGER.info("Follow the simulation by using the command:\n"
+                    "    source follow_simulation.sh %s", simulation_identifier)
+        LOGGER.info("Alternatively, the simulation manager logs can by viewed by:\n"
+                    "    docker logs --follow %s", manager_container_name)
         LOGGER.info("Platform manager has finished starting the simulation and will now stop.")
         LOGGER.info("The simulation will continue to run on the background.")
 
@@ -124,7 +129,7 @@ async def start_platform_manager():
     try:
         platform_manager = PlatformManager()
 
-        configuration_filename = cast(str, EnvironmentVariable(SIMULATION_CONFIGURATION_FILE, str, "").value)
+        configuration_filename = env_str(SIMULATION_CONFIGURATION_FILE)
         start_check = await platform_manager.start_simulation(configuration_filename)
         if start_check:
             LOGGER.debug("A new simulation run started.")
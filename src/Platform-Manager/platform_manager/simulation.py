@@ -9,12 +9,18 @@ This module contains data classes for storing the configuration for a single sim
 """
 
 import dataclasses
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import yaml
 
 from tools.datetime_tools import get_utcnow_in_milliseconds, to_iso_format_datetime_string
 from tools.tools import FullLogger
 
+# Use the LibYAML based loader when PyYAML has been built with it, since it is considerably faster.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore
+
 LOGGER = FullLogger(__name__)
 
 # The main attributes in simulation configuration file
@@ -41,21 +47,75 @@ MESSAGE_BUFFER_MAX_INTERVAL = "MessageBufferMaxInterval"
 SIMULATION_NAME_FOR_MANAGER = "SimulationName"
 SIMULATION_DESCRIPTION_FOR_MANAGER = "SimulationDescription"
 
+# The attributes for the simulation manager and the log writer that are taken from the Simulation block:
+# (attribute name in the simulation configuration file, attribute name for the component, optional conversion)
+AttributeMapType = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+MANAGER_ATTRIBUTE_MAP = (
+    (SIMULATION_START_TIME, SIMULATION_START_TIME, to_iso_format_datetime_string),
+    (SIMULATION_EPOCH_LENGTH, SIMULATION_EPOCH_LENGTH, None),
+    (SIMULATION_MAX_EPOCH_COUNT, SIMULATION_MAX_EPOCH_COUNT, None),
+    (SIMULATION_MANAGER_NAME, SIMULATION_MANAGER_NAME, None),
+    (SIMULATION_EPOCH_TIMER_INTERVAL, SIMULATION_EPOCH_TIMER_INTERVAL, None),
+    (SIMULATION_MAX_EPOCH_RESEND_COUNT, SIMULATION_MAX_EPOCH_RESEND_COUNT, None),
+    (SIMULATION_NAME, SIMULATION_NAME_FOR_MANAGER, None),
+    (SIMULATION_DESCRIPTION, SIMULATION_DESCRIPTION_FOR_MANAGER, None)
+)  # type: AttributeMapType
+LOG_WRITER_ATTRIBUTE_MAP = (
+    (MESSAGE_BUFFER_MAX_DOCUMENTS, MESSAGE_BUFFER_MAX_DOCUMENTS, None),
+    (MESSAGE_BUFFER_MAX_INTERVAL, MESSAGE_BUFFER_MAX_INTERVAL, None)
+)  # type: AttributeMapType
+
 # The special attribute that can be used to create multiple identical components for the simulation
 DUPLICATION_COUNT = "duplication_count"
 
 DUPLICATE_CONTAINER_NAME_SEPARATOR = "_"
 
 
-def remove_nones(dictionary: dict) -> dict:
-    """remove_nones"""
-    return {
-        dictionary_key: key_value
-        for dictionary_key, key_value in dictionary.items()
-        if key_value is not None
+def get_instance_names(component_name: str, duplication_count: int) -> List[str]:
+    """
+    Returns the names for the instances of the given component.
+    A component without duplicates uses the component name as is, otherwise the instances are numbered from 1.
+    """
+    if duplication_count == 1:
+        return [component_name]
+    return [
+        DUPLICATE_CONTAINER_NAME_SEPARATOR.join((component_name, str(index)))
+        for index in range(1, duplication_count + 1)
+    ]
+
+
+def get_mapped_attributes(configuration: Dict[str, Any], attribute_map: AttributeMapType) -> Dict[str, Any]:
+    """
+    Returns the attributes defined by the attribute map from the given configuration.
+    The attributes that are missing or whose value is None, also after the conversion, are not included.
+    """
+    attributes = {}
+    for source_name, target_name, conversion in attribute_map:
+        attribute_value = configuration.get(source_name, None)
+        if attribute_value is not None and conversion is not None:
+            attribute_value = conversion(attribute_value)
+        if attribute_value is not None:
+            attributes[target_name] = attribute_value
+    return attributes
+
+
+def with_slots(data_class: type) -> type:
+    """
+    Returns a copy of the given data class that uses __slots__ for the fields instead of a per-instance dictionary.
+    Corresponds to dataclasses.dataclass(slots=True) that is only available from Python 3.10 onwards.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(data_class))
+    class_dict = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in data_class.__dict__.items()
+        # the default values are stored in the generated __init__ and must not conflict with the slots
+        if attribute_name not in field_names and attribute_name not in ("__dict__", "__weakref__")
     }
+    class_dict["__slots__"] = field_names
+    return type(data_class)(data_class.__name__, data_class.__bases__, class_dict)
 
 
+@with_slots
 @dataclasses.dataclass
 class SimulationComponentConfiguration:
     """
@@ -67,6 +127,7 @@ class SimulationComponentConfiguration:
     attributes: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
 
+@with_slots
 @dataclasses.dataclass
 class SimulationComponentTypeConfiguration:
     """
@@ -77,6 +138,7 @@ class SimulationComponentTypeConfiguration:
     processes: Dict[str, SimulationComponentConfiguration] = dataclasses.field(default_factory=dict)
 
 
+@with_slots
 @dataclasses.dataclass
 class SimulationGeneralConfiguration:
     """
@@ -94,6 +156,7 @@ class SimulationGeneralConfiguration:
     description: str = ""
 
 
+@with_slots
 @dataclasses.dataclass
 class SimulationConfiguration:
     """
@@ -111,69 +174,40 @@ def load_simulation_parameters_from_yaml(yaml_filename: str) -> Optional[Simulat
     Returns None, if there is a problem loading the simulation parameters.
     """
     try:
-        with open(yaml_filename, mode="r", encoding="UTF-8") as yaml_file:
-            yaml_configuration = yaml.safe_load(yaml_file)
+        with open(yaml_filename, mode="rb") as yaml_file:
+            yaml_configuration = yaml.load(yaml_file, Loader=YamlSafeLoader)
 
         # load the component specific parameters for the simulation run
-        component_configurations = {
-            component_type: SimulationComponentTypeConfiguration(
-                processes={
-                    component_name: SimulationComponentConfiguration(
-                        duplication_count=(
-                            1 if component_attributes is None
-                            else component_attributes.get(DUPLICATION_COUNT, 1)
-                        ),
-                        attributes={
-                            attribute_name: attribute_value
-                            for attribute_name, attribute_value in (
-                                {}.items() if component_attributes is None
-                                else component_attributes.items()
-                            )
-                            if attribute_name != DUPLICATION_COUNT
-                        }
-                    )
-                    for component_name, component_attributes in (
-                        {}.items() if component_type_processes is None
-                        else component_type_processes.items()
-                    )
-                }
-            )
-            for component_type, component_type_processes in yaml_configuration.get(COMPONENTS, {}).items()
-        }
+        component_configurations = {}  # type: Dict[str, SimulationComponentTypeConfiguration]
+        # the names of all component instances are collected for the simulation manager at the same time
+        component_instance_names = []  # type: List[str]
+        for component_type, component_type_processes in (yaml_configuration.get(COMPONENTS, None) or {}).items():
+            processes = {}  # type: Dict[str, SimulationComponentConfiguration]
+            for component_name, component_attributes in (component_type_processes or {}).items():
+                # the duplication count is not passed on to the component as an attribute
+                attributes = dict(component_attributes) if component_attributes else {}
+                duplication_count = attributes.pop(DUPLICATION_COUNT, 1)
+                processes[component_name] = SimulationComponentConfiguration(
+                    duplication_count=duplication_count,
+                    attributes=attributes
+                )
+                component_instance_names.extend(get_instance_names(component_name, duplication_count))
+            component_configurations[component_type] = SimulationComponentTypeConfiguration(processes=processes)
 
         # load the simulation manager parameters for the simulation run
         simulation_configuration = yaml_configuration.get(SIMULATION, {})
 
-        manager_attributes = {
-            SIMULATION_START_TIME: to_iso_format_datetime_string(
-                simulation_configuration.get(SIMULATION_START_TIME, None)),
-            SIMULATION_EPOCH_LENGTH: simulation_configuration.get(SIMULATION_EPOCH_LENGTH, None),
-            SIMULATION_MAX_EPOCH_COUNT: simulation_configuration.get(SIMULATION_MAX_EPOCH_COUNT, None),
-            SIMULATION_MANAGER_NAME: simulation_configuration.get(SIMULATION_MANAGER_NAME, None),
-            SIMULATION_EPOCH_TIMER_INTERVAL: simulation_configuration.get(SIMULATION_EPOCH_TIMER_INTERVAL, None),
-            SIMULATION_MAX_EPOCH_RESEND_COUNT: simulation_configuration.get(SIMULATION_MAX_EPOCH_RESEND_COUNT, None),
-            SIMULATION_NAME_FOR_MANAGER: simulation_configuration.get(SIMULATION_NAME, None),
-            SIMULATION_DESCRIPTION_FOR_MANAGER: simulation_configuration.get(SIMULATION_DESCRIPTION, None),
-            COMPONENTS: [
-                component_name if component_configuration.duplication_count == 1
-                else DUPLICATE_CONTAINER_NAME_SEPARATOR.join([component_name, str(index)])
-                for _, processes in component_configurations.items()
-                for component_name, component_configuration in processes.processes.items()
-                for index in range(1, component_configuration.duplication_count + 1)
-            ]
-        }
+        manager_attributes = get_mapped_attributes(simulation_configuration, MANAGER_ATTRIBUTE_MAP)
+        manager_attributes[COMPONENTS] = component_instance_names
 
         # load the log writer parameters for the simulation run
-        log_writer_attributes = {
-            MESSAGE_BUFFER_MAX_DOCUMENTS: simulation_configuration.get(MESSAGE_BUFFER_MAX_DOCUMENTS, None),
-            MESSAGE_BUFFER_MAX_INTERVAL: simulation_configuration.get(MESSAGE_BUFFER_MAX_INTERVAL, None)
-        }
+        log_writer_attributes = get_mapped_attributes(simulation_configuration, LOG_WRITER_ATTRIBUTE_MAP)
 
         # collect all the general simulation parameters
         general_configuration = SimulationGeneralConfiguration(
             simulation_id=get_utcnow_in_milliseconds(),
-            manager_configuration=SimulationComponentConfiguration(attributes=remove_nones(manager_attributes)),
-            logwriter_configuration=SimulationComponentConfiguration(attributes=remove_nones(log_writer_attributes))
+            manager_configuration=SimulationComponentConfiguration(attributes=manager_attributes),
+            logwriter_configuration=SimulationComponentConfiguration(attributes=log_writer_attributes)
         )
         if SIMULATION_NAME in simulation_configuration:
             general_configuration.simulation_name = simulation_configuration[SIMULATION_NAME]
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Tampere University and VTT Technical Research Centre of Finland
+# This software was developed as a part of the ProCemPlus project: https://www.senecc.fi/projects/procemplus
+# This source code is licensed under the MIT license. See LICENSE in the repository root directory.
+# Author(s): Ville Heikkilä <ville.heikkila@tuni.fi>
+
+"""Unit tests for the ContainerStarter class."""
+
+import json
+import unittest
+from typing import Any, Dict, List, Optional
+
+from aiodocker.containers import DockerContainer
+from aiohttp import ServerDisconnectedError
+from aiodocker.exceptions import DockerError
+from aiounittest.case import AsyncTestCase
+
+from platform_manager.docker_runner import ContainerConfiguration, ContainerStarter
+
+
+class FakeContainer(DockerContainer):
+    """Docker container that only records the calls made to it."""
+    def __init__(self, container_name: str):
+        super().__init__(None, Id=container_name, Names=["/" + container_name])
+        self.container_name = container_name
+        self.started = False
+        self.stopped = False
+        self.deleted = False
+
+    async def start(self, **kwargs):
+        self.started = True
+
+    async def stop(self, **kwargs):
+        if self.container_name.endswith("_stuck"):
+            raise DockerError(500, {"message": "Could not stop the container"})
+        self.stopped = True
+
+    async def delete(self, **kwargs):
+        self.deleted = True
+
+
+class FakeContainers:
+    """Replacement for the containers attribute of the aiodocker client."""
+    def __init__(self):
+        self.container_names = []  # type: List[str]
+        self.list_parameters = []  # type: List[Dict[str, Any]]
+        self.created = []  # type: List[FakeContainer]
+        self.conflicting_names = set()
+        self.listed = []  # type: List[FakeContainer]
+
+    async def list(self, **kwargs) -> List[FakeContainer]:
+        self.list_parameters.append(kwargs)
+        self.listed = [FakeContainer(container_name) for container_name in self.container_names]
+        return self.listed
+
+    async def create(self, name: str, config: Dict[str, Any]) -> FakeContainer:
+        if name in self.conflicting_names:
+            raise DockerError(409, {"message": "Conflict. The container name {} is already in use.".format(name)})
+        container = FakeContainer(name)
+        self.created.append(container)
+        return container
+
+
+class FakeNetworks:
+    """Replacement for the networks attribute of the aiodocker client."""
+    async def list(self) -> List[Dict[str, str]]:
+        return [{"Name": "network", "Id": "network-id"}, {"Name": "other", "Id": "other-id"}]
+
+
+class FakeDocker:
+    """Replacement for the aiodocker client."""
+    def __init__(self):
+        self.containers = FakeContainers()
+        self.networks = FakeNetworks()
+        # the results for the network connection requests: None for success, otherwise the exception
+        # (exception, True) means that the exception is raised after the container has been connected
+        self.connect_results = []  # type: List[Optional[Any]]
+        self.connect_requests = 0
+        self.connected_containers = {}  # type: Dict[str, List[str]]
+
+    async def _query_json(self, path: str, method: str = "GET", data: Optional[bytes] = None) -> Any:
+        """Handles the network requests made by the aiodocker DockerNetwork class."""
+        path_parts = path.split("/")
+        network_id = path_parts[1]
+        if method == "GET":
+            return {
+                "Id": network_id,
+                "Containers": {
+                    "id-" + container_name: {"Name": container_name}
+                    for container_name in self.connected_containers.get(network_id, [])
+                }
+            }
+
+        self.connect_requests += 1
+        connect_result = self.connect_results.pop(0) if self.connect_results else None
+        if isinstance(connect_result, tuple):
+            connect_result, is_connected = connect_result
+        else:
+            is_connected = connect_result is None
+        if is_connected:
+            self.connected_containers.setdefault(network_id, []).append(json.loads(data)["Container"])
+        if connect_result is not None:
+            raise connect_result
+        return None
+
+
+def get_configurations(*container_names: str) -> List[ContainerConfiguration]:
+    """Returns container configurations with the given names."""
+    return [
+        ContainerConfiguration(container_name, "image:latest", {"VARIABLE": 1}, "network", [])
+        for container_name in container_names
+    ]
+
+
+class TestSimulationIndexSelection(AsyncTestCase):
+    """Unit tests for the simulation index selection in the ContainerStarter class."""
+
+    def setUp(self):
+        self.docker = FakeDocker()
+        self.container_starter = ContainerStarter(self.docker)
+
+    async def test_no_containers(self):
+        """Unit test for getting the first index when there are no simulation containers."""
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 0)
+
+        # all the existing containers, also the ones that are not running, are included in the check
+        list_parameters = self.docker.containers.list_parameters[-1]
+        self.assertIn("all", list_parameters)
+        self.assertEqual(json.loads(list_parameters["filters"]), {"name": [ContainerStarter.PREFIX_START]})
+
+    async def test_used_indexes(self):
+        """Unit test for getting the smallest index that is not used by the existing containers."""
+        self.docker.containers.container_names = [
+            "Sim00_manager", "Sim01_manager", "Sim01_logwriter", "Sim03_manager",
+            # names that do not contain a valid simulation index
+            "Sim2_manager", "Sim0a_manager", "Sim04manager", "Simulation", "other_container"
+        ]
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 2)
+
+    async def test_all_indexes_used(self):
+        """Unit test for getting None when all the indexes are in use."""
+        self.docker.containers.container_names = ["Sim{:02d}_manager".format(index) for index in range(100)]
+        self.assertIsNone(await self.container_starter.get_next_simulation_index())
+
+        self.docker.containers.container_names.remove("Sim42_manager")
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 42)
+
+    async def test_changes_between_calls(self):
+        """Unit test for noticing the indexes freed or taken by others between the calls."""
+        self.docker.containers.container_names = ["Sim00_manager"]
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 1)
+
+        # the container was removed automatically after the simulation finished
+        self.docker.containers.container_names = []
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 0)
+
+        # another process started a simulation
+        self.docker.containers.container_names = ["Sim00_manager", "Sim01_manager"]
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 2)
+
+    async def test_start_simulation(self):
+        """Unit test for starting the simulation containers with the next free index."""
+        self.docker.containers.container_names = ["Sim00_manager"]
+        container_names = await self.container_starter.start_simulation(get_configurations("logwriter", "manager"))
+        self.assertEqual(container_names, ["Sim01_logwriter", "Sim01_manager"])
+        self.assertTrue(all(container.started for container in self.docker.containers.created))
+
+        self.docker.containers.container_names.extend(container_names)
+        self.assertEqual(await self.container_starter.get_next_simulation_index(), 2)
+
+    async def test_name_conflict(self):
+        """Unit test for not reusing an index after a name conflict when the conflicting container exists."""
+        self.docker.containers.conflicting_names = {"Sim00_manager"}
+        container_names = await self.container_starter.start_simulation(get_configurations("logwriter", "manager"))
+        self.assertIsNone(container_names)
+        # the already created container was removed
+        self.assertEqual(len(self.docker.containers.created), 1)
+        self.assertTrue(self.docker.containers.created[0].deleted)
+
+        # the conflicting container exists even though it is not running
+        self.docker.containers.container_names = ["Sim00_manager"]
+        self.docker.containers.conflicting_names = set()
+        container_names = await self.container_starter.start_simulation(get_configurations("logwriter", "manager"))
+        self.assertEqual(container_names, ["Sim01_logwriter", "Sim01_manager"])
+
+
+class TestStopContainers(AsyncTestCase):
+    """Unit tests for stopping the simulation containers with the ContainerStarter class."""
+
+    def setUp(self):
+        self.docker = FakeDocker()
+        self.container_starter = ContainerStarter(self.docker)
+        self.docker.containers.container_names = [
+            "Sim00_manager", "Sim00_stuck", "Sim01_manager", "Sim0a_manager", "other_container"]
+
+    def get_stopped_names(self) -> List[str]:
+        """Returns the names of the stopped containers."""
+        return [container.container_name for container in self.docker.containers.listed if container.stopped]
+
+    async def test_stop_containers(self):
+        """Unit test for stopping only the given simulation containers."""
+        await self.container_starter.stop_containers(["Sim00_manager", "Sim00_stuck", "other_container"])
+        self.assertEqual(self.get_stopped_names(), ["Sim00_manager"])
+
+    async def test_stop_all_simulation_containers(self):
+        """Unit test for stopping all the simulation containers even if one of them cannot be stopped."""
+        await self.container_starter.stop_all_simulation_containers()
+        self.assertEqual(self.get_stopped_names(), ["Sim00_manager", "Sim01_manager"])
+
+
+class TestNetworkConnection(AsyncTestCase):
+    """Unit tests for connecting the created containers to the additional networks."""
+
+    def setUp(self):
+        self.docker = FakeDocker()
+        self.container_starter = ContainerStarter(self.docker)
+        self.configuration = ContainerConfiguration("manager", "image:latest", {}, ["network", "other"], [])
+
+    async def test_connect(self):
+        """Unit test for connecting a container to the networks other than the first one."""
+        container = await self.container_starter.create_container("Sim00_manager", self.configuration)
+        self.assertIsNotNone(container)
+        self.assertEqual(self.docker.connect_requests, 1)
+        self.assertEqual(self.docker.connected_containers, {"other-id": ["Sim00_manager"]})
+
+    async def test_stale_connection_retry(self):
+        """Unit test for retrying the network connection after a stale Docker connection."""
+        self.docker.connect_results = [ServerDisconnectedError()]
+        container = await self.container_starter.create_container("Sim00_manager", self.configuration)
+        self.assertIsNotNone(container)
+        self.assertEqual(self.docker.connect_requests, 2)
+        self.assertEqual(self.docker.connected_containers, {"other-id": ["Sim00_manager"]})
+
+    async def test_connected_by_first_request(self):
+        """Unit test for accepting an error in the retry when the first request connected the container."""
+        self.docker.connect_results = [
+            (ServerDisconnectedError(), True),
+            DockerError(403, {"message": "endpoint with name Sim00_manager already exists in network other"})
+        ]
+        container = await self.container_starter.create_container("Sim00_manager", self.configuration)
+        self.assertIsNotNone(container)
+        self.assertEqual(self.docker.connect_requests, 2)
+
+    async def test_connection_errors(self):
+        """Unit test for failing the container creation when the network connection fails."""
+        # an error from the Docker Engine is not retried
+        self.docker.connect_results = [DockerError(404, {"message": "No such container"})]
+        self.assertIsNone(await self.container_starter.create_container("Sim00_manager", self.configuration))
+        self.assertEqual(self.docker.connect_requests, 1)
+
+        # an error in the retry when the container was not connected by the first request
+        self.docker.connect_results = [
+            ServerDisconnectedError(),
+            DockerError(404, {"message": "No such container"})
+        ]
+        self.assertIsNone(await self.container_starter.create_container("Sim01_manager", self.configuration))
+        self.assertEqual(self.docker.connect_requests, 3)
+        self.assertEqual(self.docker.connected_containers, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Tampere University and VTT Technical Research Centre of Finland
+# This software was developed as a part of the ProCemPlus project: https://www.senecc.fi/projects/procemplus
+# This source code is licensed under the MIT license. See LICENSE in the repository root directory.
+# Author(s): Ville Heikkilä <ville.heikkila@tuni.fi>
+
+"""Unit tests for the ManifestCache class."""
+
+import os
+import pathlib
+import tempfile
+import unittest
+
+from platform_manager.manifest_cache import ManifestCache
+
+MANIFEST_CONTENT = {"Name": "Component", "Attributes": {"A": {"Optional": True, "Default": 1.5}}}
+OTHER_MANIFEST_CONTENT = {"Name": "Other", "Attributes": {}}
+
+
+class TestManifestCache(unittest.TestCase):
+    """Unit tests for the ManifestCache class."""
+
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self.temp_folder.name)
+        self.cache_filename = self.folder / "manifest_cache.json"
+        self.manifest_filename = self.write_file("manifest.yml", "Name: Component\n")
+        self.other_filename = self.write_file("other.yml", "Name: Other\n")
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def write_file(self, filename: str, content: str) -> str:
+        """Writes the given content to a file in the test folder and returns the full filename."""
+        full_filename = self.folder / filename
+        full_filename.write_text(content, encoding="UTF-8")
+        return str(full_filename)
+
+    def test_cache_hit(self):
+        """Unit test for getting the cached content for an unchanged file after saving and loading the cache."""
+        cache = ManifestCache(self.cache_filename)
+        self.assertIsNone(cache.get(self.manifest_filename, os.stat(self.manifest_filename)))
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        self.assertEqual(cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+        cache.save()
+        self.assertTrue(self.cache_filename.is_file())
+
+        loaded_cache = ManifestCache(self.cache_filename)
+        self.assertEqual(
+            loaded_cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+
+    def test_cache_miss_on_change(self):
+        """Unit test for not returning the cached content when the modification time or the size has changed."""
+        cache = ManifestCache(self.cache_filename)
+        original_stat = os.stat(self.manifest_filename)
+        cache.set(self.manifest_filename, original_stat, MANIFEST_CONTENT)
+
+        # the same size but a different modification time
+        os.utime(self.manifest_filename, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns + 10 ** 9))
+        changed_stat = os.stat(self.manifest_filename)
+        self.assertEqual(changed_stat.st_size, original_stat.st_size)
+        self.assertIsNone(cache.get(self.manifest_filename, changed_stat))
+
+        # the same modification time but a different size
+        self.write_file("manifest.yml", "Name: Changed component\n")
+        os.utime(self.manifest_filename, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        resized_stat = os.stat(self.manifest_filename)
+        self.assertEqual(resized_stat.st_mtime_ns, original_stat.st_mtime_ns)
+        self.assertIsNone(cache.get(self.manifest_filename, resized_stat))
+
+        self.assertEqual(cache.get(self.manifest_filename, original_stat), MANIFEST_CONTENT)
+
+    def test_unused_entries_pruned(self):
+        """Unit test for removing the entries that were not used during the run when the cache is saved."""
+        cache = ManifestCache(self.cache_filename)
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        cache.set(self.other_filename, os.stat(self.other_filename), OTHER_MANIFEST_CONTENT)
+        cache.save()
+
+        # only the first file is used during the second run
+        second_cache = ManifestCache(self.cache_filename)
+        self.assertEqual(
+            second_cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+        second_cache.save()
+
+        third_cache = ManifestCache(self.cache_filename)
+        self.assertEqual(
+            third_cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+        self.assertIsNone(third_cache.get(self.other_filename, os.stat(self.other_filename)))
+
+    def test_uncacheable_content(self):
+        """Unit test for not caching content that would change when stored as JSON."""
+        cache = ManifestCache(self.cache_filename)
+        for content in [{1: "non-string key"}, {"Value": (1, 2)}, {"Value": {1, 2}}]:
+            with self.subTest(content=content):
+                cache.set(self.manifest_filename, os.stat(self.manifest_filename), content)
+                self.assertIsNone(cache.get(self.manifest_filename, os.stat(self.manifest_filename)))
+
+        cache.save()
+        self.assertFalse(self.cache_filename.exists())
+
+    def test_invalid_cache_file(self):
+        """Unit test for starting with an empty cache when the cache file cannot be parsed."""
+        self.cache_filename.write_text("{not valid JSON", encoding="UTF-8")
+        cache = ManifestCache(self.cache_filename)
+        self.assertIsNone(cache.get(self.manifest_filename, os.stat(self.manifest_filename)))
+
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        cache.save()
+        loaded_cache = ManifestCache(self.cache_filename)
+        self.assertEqual(
+            loaded_cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+
+    def test_save_replaces_cache_file(self):
+        """Unit test for replacing the cache file without leaving temporary files to the folder."""
+        cache = ManifestCache(self.cache_filename)
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        cache.save()
+        cache.set(self.other_filename, os.stat(self.other_filename), OTHER_MANIFEST_CONTENT)
+        cache.save()
+
+        self.assertEqual(
+            sorted(path.name for path in self.folder.iterdir()),
+            sorted([self.cache_filename.name, "manifest.yml", "other.yml"]))
+        loaded_cache = ManifestCache(self.cache_filename)
+        self.assertEqual(
+            loaded_cache.get(self.other_filename, os.stat(self.other_filename)), OTHER_MANIFEST_CONTENT)
+
+    def test_save_failure(self):
+        """Unit test for keeping the cache in memory when the cache file cannot be written."""
+        cache_filename = self.folder / "missing_folder" / "manifest_cache.json"
+        cache = ManifestCache(cache_filename)
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        cache.save()
+
+        self.assertFalse(cache_filename.parent.exists())
+        self.assertEqual(cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+
+    def test_memory_only_cache(self):
+        """Unit test for a cache without a cache file."""
+        cache = ManifestCache(None)
+        cache.set(self.manifest_filename, os.stat(self.manifest_filename), MANIFEST_CONTENT)
+        self.assertEqual(cache.get(self.manifest_filename, os.stat(self.manifest_filename)), MANIFEST_CONTENT)
+        cache.save()
+        self.assertFalse(self.cache_filename.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
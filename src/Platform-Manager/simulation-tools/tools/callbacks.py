@@ -9,6 +9,7 @@
 import asyncio
 import inspect
 import json
+import logging
 from typing import Awaitable, Callable, Union
 
 import aio_pika.message
@@ -48,10 +49,11 @@ class MessageCallback():
            Otherwise, the given message type is used for as transformed message type.
            The legal string for the parameter message_type are defined in tools.messages.MESSAGE_TYPES
         """
-        self.__lock = asyncio.Lock()
         self.__callback_function = callback_function
+        # the callback function does not change, so it is enough to check whether it is awaitable only once
+        self.__is_awaitable_callback = inspect.iscoroutinefunction(callback_function)
 
-        if message_type is not None and message_type not in MessageFactory.get_message_types():
+        if message_type is not None and not MessageFactory.has_message_type(message_type):
             self.__message_type = self.__class__.DEFAULT_MESSAGE_TYPE
         else:
             self.__message_type = message_type
@@ -69,85 +71,127 @@ class MessageCallback():
         """Returns the topic from which the last message was received."""
         return self.__last_topic
 
+    def __log_simulation_state_message(self) -> None:
+        """Writes a log message about the last received simulation state message."""
+        LOGGER.info("Received simulation state message '%s' from '%s'",
+                    self.__last_message.simulation_state, self.__last_message.source_process_id)
+
+    def __log_epoch_message(self) -> None:
+        """Writes a log message about the last received epoch message."""
+        LOGGER.info("Epoch message received from '%s' for epoch number %d (%s - %s)",
+                    self.__last_message.source_process_id, self.__last_message.epoch_number,
+                    self.__last_message.start_time, self.__last_message.end_time)
+
+    def __log_status_message(self) -> None:
+        """Writes a log message about the last received status message."""
+        LOGGER.info("Status message received from '%s' for epoch number %d with value: %s",
+                    self.__last_message.source_process_id, self.__last_message.epoch_number,
+                    self.__last_message.value)
+
+    def __log_result_message(self) -> None:
+        """Writes a log message about the last received result message."""
+        LOGGER.info("Received '%s' message from '%s' for epoch %d",
+                    self.__last_message.message_type,
+                    self.__last_message.source_process_id,
+                    self.__last_message.epoch_number)
+
+    def __log_abstract_message(self) -> None:
+        """Writes a log message about the last received message that is not a result message."""
+        LOGGER.info("Received '%s' message from '%s' on topic '%s'",
+                    self.__last_message.message_type,
+                    self.__last_message.source_process_id,
+                    self.__last_topic)
+
+    def __log_base_message(self) -> None:
+        """Writes a log message about the last received message that has only the base message attributes."""
+        LOGGER.info("Received message from topic '%s'", self.__last_topic)
+
+    def __log_json_message(self) -> None:
+        """Writes a log message about the last received JSON message that was not a valid message."""
+        if LOGGER.logger.isEnabledFor(logging.INFO):
+            LOGGER.info("Received a JSON message with errors: '%s'", json.dumps(self.__last_message))
+
+    def __log_missing_message(self) -> None:
+        """Writes a log message about a missing last message."""
+        LOGGER.warning("No last message found.")
+
+    def __log_unknown_message(self) -> None:
+        """Writes a log message about the last received message that is in an unknown format."""
+        LOGGER.warning("The last message in unknown format: '%s'", self.__last_message)
+
+    # the log functions for the message types, the lookup is done using the exact message type
+    # for other types, the function for the nearest base class is used and added to the dictionary
+    __LOG_FUNCTIONS = {
+        SimulationStateMessage: __log_simulation_state_message,
+        EpochMessage: __log_epoch_message,
+        StatusMessage: __log_status_message,
+        AbstractResultMessage: __log_result_message,
+        AbstractMessage: __log_abstract_message,
+        BaseMessage: __log_base_message,
+        dict: __log_json_message,
+        type(None): __log_missing_message,
+        object: __log_unknown_message
+    }
+
     def log_last_message(self) -> None:
         """Writes a log message based on the last received message."""
-        if isinstance(self.last_message, SimulationStateMessage):
-            LOGGER.info("Received simulation state message '{:s}' from '{:s}'".format(
-                self.last_message.simulation_state, self.last_message.source_process_id))
-        elif isinstance(self.last_message, EpochMessage):
-            LOGGER.info("Epoch message received from '{:s}' for epoch number {:d} ({:s} - {:s})".format(
-                self.last_message.source_process_id,
-                self.last_message.epoch_number,
-                self.last_message.start_time,
-                self.last_message.end_time))
-        elif isinstance(self.last_message, StatusMessage):
-            LOGGER.info("Status message received from '{:s}' for epoch number {:d} with value: {:s}".format(
-                self.last_message.source_process_id,
-                self.last_message.epoch_number,
-                self.last_message.value))
-        elif isinstance(self.last_message, AbstractResultMessage):
-            LOGGER.info("Received '{:s}' message from '{:s}' for epoch {:d}".format(
-                self.last_message.message_type,
-                self.last_message.source_process_id,
-                self.last_message.epoch_number))
-        elif isinstance(self.last_message, AbstractMessage):
-            LOGGER.info("Received '{:s}' message from '{:s}' on topic '{:s}'".format(
-                self.last_message.message_type,
-                self.last_message.source_process_id,
-                self.last_topic))
-        elif isinstance(self.last_message, BaseMessage):
-            LOGGER.info("Received message from topic '{:s}'".format(self.last_topic))
-        elif isinstance(self.last_message, dict):
-            LOGGER.info("Received a JSON message with errors: '{:s}'".format(json.dumps(self.last_message)))
-        elif self.last_message is None:
-            LOGGER.warning("No last message found.")
-        else:
-            LOGGER.warning("The last message in unknown format: '{:s}'".format(str(self.last_message)))
+        log_functions = self.__class__.__LOG_FUNCTIONS
+        message_type = type(self.last_message)
+        log_function = log_functions.get(message_type, None)
+        if log_function is None:
+            log_function = next(
+                log_functions[base_type]
+                for base_type in message_type.__mro__
+                if base_type in log_functions
+            )
+            log_functions[message_type] = log_function
+        log_function(self)
 
     async def callback(self, message: aio_pika.message.IncomingMessage) -> None:
         """Callback function for the received messages from the message bus.
            Transforms the message to an instance of AbstractMessage and sends it to the callback_function.
         """
-        # Use a lock to be able to handle each incoming message one at a time.
-        async with self.__lock:
-            message_str = ""
-            message_json = {}
-            try:
-                message_str = message.body.decode(MessageCallback.MESSAGE_CODING)
-                message_json = json.loads(message_str)
-
-                if self.__message_type is None:
-                    # Convert the message to the specified special cases if possible.
-                    expected_message_type = message_json.get(
-                        self.__class__.MESSAGE_TYPE_ATTRIBUTE,
-                        self.__class__.DEFAULT_MESSAGE_TYPE)
-                    if expected_message_type not in MessageFactory.get_message_types():
-                        expected_message_type = self.__class__.DEFAULT_MESSAGE_TYPE
-                else:
-                    expected_message_type = self.__message_type
-
-                message_object = MessageFactory.get_message(
-                    message_type=expected_message_type,
-                    **message_json,
-                )
-
-            except json.decoder.JSONDecodeError:
-                LOGGER.warning("Received message could not be decoded into JSON format.")
-                message_object = message_str
-            except (TypeError, ValueError, MessageError) as message_error:
-                # The message did not conform to the simulation platform message schema or
-                # the message type was not supported by the message factory.
-                LOGGER.warning("Received {:s} error when creating message object: {:s}".format(
-                    type(message_error).__name__, str(message_error)
-                ))
-                message_object = message_json
-
-            self.__last_message = message_object
-            self.__last_topic = message.routing_key
-            self.log_last_message()
-
-            if inspect.iscoroutinefunction(self.__callback_function):
-                asyncio.create_task(self.__callback_function(message_object, message.routing_key))
+        # The message handling does not await anything before the callback function is scheduled,
+        # so each incoming message is handled fully before the next one without any explicit locking.
+        message_json = {}
+        try:
+            # json decodes the UTF-8 encoded message body directly,
+            # the body is decoded to a string only if it cannot be parsed as JSON.
+            # orjson is not used here since it rejects the NaN and Infinity values that the messages can contain
+            # and it converts integers wider than 64 bits to floats.
+            message_json = json.loads(message.body)
+
+            if self.__message_type is None:
+                # Convert the message to the specified special cases if possible.
+                expected_message_type = message_json.get(
+                    self.__class__.MESSAGE_TYPE_ATTRIBUTE,
+                    self.__class__.DEFAULT_MESSAGE_TYPE)
+                if not MessageFactory.has_message_type(expected_message_type):
+                    expected_message_type = self.__class__.DEFAULT_MESSAGE_TYPE
             else:
-                LOGGER.error("Callback function '{:s}' is not awaitable.".format(
-                    str(getattr(self.__callback_function, "__name__", None))))
+                expected_message_type = self.__message_type
+
+            message_object = MessageFactory.get_message(
+                message_type=expected_message_type,
+                **message_json,
+            )
+
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError):
+            LOGGER.warning("Received message could not be decoded into JSON format.")
+            message_object = message.body.decode(MessageCallback.MESSAGE_CODING, errors="replace")
+        except (TypeError, ValueError, MessageError) as message_error:
+            # The message did not conform to the simulation platform message schema or
+            # the message type was not supported by the message factory.
+            LOGGER.warning("Received %s error when creating message object: %s",
+                           type(message_error).__name__, message_error)
+            message_object = message_json
+
+        self.__last_message = message_object
+        self.__last_topic = message.routing_key
+        self.log_last_message()
+
+        if self.__is_awaitable_callback:
+            asyncio.create_task(self.__callback_function(message_object, message.routing_key))
+        else:
+            LOGGER.error("Callback function '%s' is not awaitable.",
+                         getattr(self.__callback_function, "__name__", None))
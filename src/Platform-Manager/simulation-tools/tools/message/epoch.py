@@ -8,21 +8,84 @@
 
 from __future__ import annotations
 import datetime
-from typing import Any, Dict, Union
+import functools
+from typing import Any, Dict, Optional, Union
 
-from tools.datetime_tools import to_iso_format_datetime_string
-from tools.exceptions.messages import MessageDateError, MessageValueError
+from tools.datetime_tools import UTC_TIMEZONE_MARK, to_iso_format_datetime_string
+from tools.exceptions.messages import MessageDateError, MessageError, MessageValueError
 from tools.message.abstract import AbstractResultMessage
 from tools.tools import FullLogger
 
 LOGGER = FullLogger(__name__)
 
+# the maximum number of cached epoch time string conversions
+EPOCH_TIME_CACHE_SIZE = 4096
+# the lengths of the UTC datetime strings "YYYY-MM-DDTHH:MM:SSZ" and "YYYY-MM-DDTHH:MM:SS.mmmZ"
+DATETIME_STRING_LENGTH_SECONDS = 20
+DATETIME_STRING_LENGTH_MILLISECONDS = 24
+
+
+def _parse_utc_datetime_string(datetime_str: str) -> Optional[str]:
+    """Returns the given UTC datetime string in the ISO 8601 format used in the messages,
+       if the string is already in that format, possibly without the milliseconds.
+       Otherwise, returns None and the string must be converted using the generic conversion."""
+    string_length = len(datetime_str)
+    if string_length == DATETIME_STRING_LENGTH_MILLISECONDS:
+        if datetime_str[19] != ".":
+            return None
+        millisecond_digits = datetime_str[20:23]
+    elif string_length == DATETIME_STRING_LENGTH_SECONDS:
+        millisecond_digits = ""
+    else:
+        return None
+
+    if (datetime_str[-1] != UTC_TIMEZONE_MARK or datetime_str[4] != "-" or datetime_str[7] != "-" or
+            datetime_str[10] != "T" or datetime_str[13] != ":" or datetime_str[16] != ":"):
+        return None
+
+    year, month, day = datetime_str[0:4], datetime_str[5:7], datetime_str[8:10]
+    hour, minute, second = datetime_str[11:13], datetime_str[14:16], datetime_str[17:19]
+    all_digits = year + month + day + hour + minute + second + millisecond_digits
+    if not all_digits.isascii() or not all_digits.isdigit():
+        return None
+
+    try:
+        # constructing the datetime object checks that the date and the time are valid
+        datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return None
+
+    if string_length == DATETIME_STRING_LENGTH_SECONDS:
+        return datetime_str[:-1] + ".000" + UTC_TIMEZONE_MARK
+    return datetime_str
+
+
+@functools.lru_cache(maxsize=EPOCH_TIME_CACHE_SIZE)
+def _to_iso_format_string_cached(datetime_str: str) -> Optional[str]:
+    """Returns the result of to_iso_format_datetime_string for the given string using a cache.
+       The same epoch start and end times are repeated in the epoch messages for all the components."""
+    iso_format_string = _parse_utc_datetime_string(datetime_str)
+    if iso_format_string is not None:
+        return iso_format_string
+    return to_iso_format_datetime_string(datetime_str)
+
+
+def _to_epoch_time_string(datetime_value: Union[str, datetime.datetime]) -> Optional[str]:
+    """Returns the given datetime value as ISO 8601 formatted string in UTC timezone or None if the value is invalid.
+       The conversion results for string values are cached."""
+    if isinstance(datetime_value, str):
+        return _to_iso_format_string_cached(datetime_value)
+    return to_iso_format_datetime_string(datetime_value)
+
 
 class EpochMessage(AbstractResultMessage):
     """Class containing all the attributes for a epoch message."""
     CLASS_MESSAGE_TYPE = "Epoch"
     MESSAGE_TYPE_CHECK = True
 
+    # the epoch specific attributes are stored in slots, the parent classes still provide an instance dictionary
+    __slots__ = ("__start_time", "__end_time")
+
     MESSAGE_ATTRIBUTES = {
         "StartTime": "start_time",
         "EndTime": "end_time"
@@ -35,6 +98,13 @@ class EpochMessage(AbstractResultMessage):
     }
     OPTIONAL_ATTRIBUTES_FULL = AbstractResultMessage.OPTIONAL_ATTRIBUTES_FULL + OPTIONAL_ATTRIBUTES
 
+    def __init__(self, **kwargs):
+        """The start and end times are initialized to None before the attributes are set,
+           so that the setters can compare them without checking whether they exist."""
+        self.__start_time = None  # type: Optional[str]
+        self.__end_time = None  # type: Optional[str]
+        super().__init__(**kwargs)
+
     @property
     def start_time(self) -> str:
         """The attribute for the start time of the epoch."""
@@ -47,57 +117,57 @@ class EpochMessage(AbstractResultMessage):
 
     @start_time.setter
     def start_time(self, start_time: Union[str, datetime.datetime]):
-        if self._check_start_time(start_time):
-            new_start_time = to_iso_format_datetime_string(start_time)
-
+        # The conversion to the ISO 8601 format string also works as the validity check for the start time.
+        new_start_time = _to_epoch_time_string(start_time)
+        if isinstance(new_start_time, str):
             # Check that the start time is not after the end time.
-            if isinstance(new_start_time, str):
-                if getattr(self, "end_time", None) is not None and new_start_time >= self.end_time:
-                    raise MessageValueError("Epoch start time ({:s}) should be before the end time ({:s})".format(
-                        new_start_time, self.end_time))
-                self.__start_time = new_start_time
-                return
+            if self.__end_time is not None and new_start_time >= self.__end_time:
+                raise MessageValueError(
+                    f"Epoch start time ({new_start_time}) should be before the end time ({self.__end_time})")
+            self.__start_time = new_start_time
+            return
 
-        raise MessageDateError("'{:s}' is an invalid datetime".format(str(start_time)))
+        raise MessageDateError(f"'{start_time}' is an invalid datetime")
 
     @end_time.setter
     def end_time(self, end_time: Union[str, datetime.datetime]):
-        if self._check_end_time(end_time):
-            new_end_time = to_iso_format_datetime_string(end_time)
-
+        # The conversion to the ISO 8601 format string also works as the validity check for the end time.
+        new_end_time = _to_epoch_time_string(end_time)
+        if isinstance(new_end_time, str):
             # Check that the end time is not before the start time.
-            if isinstance(new_end_time, str):
-                if getattr(self, "start_time", None) is not None and new_end_time <= self.start_time:
-                    raise MessageValueError("Epoch end time ({:s}) should be after the start time ({:s})".format(
-                        new_end_time, self.start_time))
-                self.__end_time = new_end_time
-                return
+            if self.__start_time is not None and new_end_time <= self.__start_time:
+                raise MessageValueError(
+                    f"Epoch end time ({new_end_time}) should be after the start time ({self.__start_time})")
+            self.__end_time = new_end_time
+            return
 
-        raise MessageDateError("'{:s}' is an invalid datetime".format(str(end_time)))
+        raise MessageDateError(f"'{end_time}' is an invalid datetime")
 
     def __eq__(self, other: Any) -> bool:
         return (
             super().__eq__(other) and
             isinstance(other, EpochMessage) and
-            self.start_time == other.start_time and
-            self.end_time == other.end_time
+            (self.start_time, self.end_time) == (other.start_time, other.end_time)
         )
 
     @classmethod
     def _check_start_time(cls, start_time: Union[str, datetime.datetime]) -> bool:
-        return cls._check_datetime(start_time)
+        return _to_epoch_time_string(start_time) is not None
 
     @classmethod
     def _check_end_time(cls, end_time: Union[str, datetime.datetime]) -> bool:
-        return cls._check_datetime(end_time)
+        return _to_epoch_time_string(end_time) is not None
 
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[EpochMessage, None]:
         """Returns a class object created based on the given JSON attributes.
-           If the given JSON does not contain valid values, returns None."""
-        if cls.validate_json(json_message):
+           If the given JSON does not contain valid values, returns None.
+           The constructor checks all the attributes, so they are not validated separately beforehand."""
+        try:
             return cls(**json_message)
-        return None
+        except (MessageError, TypeError, ValueError) as message_error:
+            LOGGER.warning("Could not create %s from the given JSON: %s", cls.__name__, message_error)
+            return None
 
 
 EpochMessage.register_to_factory()
@@ -7,9 +7,9 @@
 """This module contains the message class for a example message."""
 
 from __future__ import annotations
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Type, Union
 
-from tools.exceptions.messages import MessageValueError
+from tools.exceptions.messages import MessageError, MessageValueError
 from tools.message.abstract import AbstractResultMessage
 from tools.message.block import QuantityBlock, QuantityArrayBlock, TimeSeriesBlock
 from tools.tools import FullLogger
@@ -151,72 +151,84 @@ class ExampleMessage(AbstractResultMessage):
         if self._check_positive_integer(positive_integer):
             self.__positive_integer = positive_integer
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: positive_integer".format(positive_integer))
+            raise MessageValueError(f"Invalid value, {positive_integer}, for attribute: positive_integer")
 
     @power_quantity.setter
     def power_quantity(self, power_quantity: Union[str, float, QuantityBlock, Dict[str, Any]]):
         if self._check_power_quantity(power_quantity):
             self._set_quantity_block_value(self.POWER_ATTRIBUTE, power_quantity)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: power_quantity".format(power_quantity))
+            raise MessageValueError(f"Invalid value, {power_quantity}, for attribute: power_quantity")
 
     @current_array.setter
     def current_array(self, current_array: Union[QuantityArrayBlock, Dict[str, Any]]):
+        current_array = self._dict_to_block(current_array, QuantityArrayBlock)
         if self._check_current_array(current_array):
             self._set_quantity_array_block_value(self.CURRENT_ARRAY_ATTRIBUTE, current_array)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: current_array".format(current_array))
+            raise MessageValueError(f"Invalid value, {current_array}, for attribute: current_array")
 
     @temperature.setter
     def temperature(self, temperature: Union[TimeSeriesBlock, Dict[str, Any]]):
+        temperature = self._dict_to_block(temperature, TimeSeriesBlock)
         if self._check_temperature(temperature):
             self._set_timeseries_block_value(self.TEMPERATURE_ATTRIBUTE, temperature)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: temperature".format(temperature))
+            raise MessageValueError(f"Invalid value, {temperature}, for attribute: temperature")
 
     @eight_characters.setter
     def eight_characters(self, eight_characters: Union[str, None]):
         if self._check_eight_characters(eight_characters):
             self.__eight_characters = eight_characters
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: eight_characters".format(eight_characters))
+            raise MessageValueError(f"Invalid value, {eight_characters}, for attribute: eight_characters")
 
     @time_quantity.setter
     def time_quantity(self, time_quantity: Union[str, float, QuantityBlock, Dict[str, Any], None]):
         if self._check_time_quantity(time_quantity):
             self._set_quantity_block_value(self.TIME_ATTRIBUTE, time_quantity)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: time_quantity".format(time_quantity))
+            raise MessageValueError(f"Invalid value, {time_quantity}, for attribute: time_quantity")
 
     @voltage_array.setter
     def voltage_array(self, voltage_array: Union[QuantityArrayBlock, Dict[str, Any], None]):
+        voltage_array = self._dict_to_block(voltage_array, QuantityArrayBlock)
         if self._check_voltage_array(voltage_array):
             self._set_quantity_array_block_value(self.VOLTAGE_ARRAY_ATTRIBUTE, voltage_array)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: voltage_array".format(voltage_array))
+            raise MessageValueError(f"Invalid value, {voltage_array}, for attribute: voltage_array")
 
     @weight.setter
     def weight(self, weight: Union[TimeSeriesBlock, Dict[str, Any], None]):
+        weight = self._dict_to_block(weight, TimeSeriesBlock)
         if self._check_weight(weight):
             self._set_timeseries_block_value(self.WEIGHT_ATTRIBUTE, weight)
         else:
-            raise MessageValueError("Invalid value, {}, for attribute: weight".format(weight))
+            raise MessageValueError(f"Invalid value, {weight}, for attribute: weight")
 
     # provide a new implementation for the "test of message equality" function
     def __eq__(self, other: Any) -> bool:
         return (
             super().__eq__(other) and
             isinstance(other, ExampleMessage) and
-            self.positive_integer == other.positive_integer and
-            self.power_quantity == other.power_quantity and
-            self.current_array == other.current_array and
-            self.temperature == other.temperature and
-            self.eight_characters == other.eight_characters and
-            self.time_quantity == other.time_quantity and
-            self.voltage_array == other.voltage_array and
-            self.weight == other.weight
+            (
+                self.positive_integer, self.power_quantity, self.current_array, self.temperature,
+                self.eight_characters, self.time_quantity, self.voltage_array, self.weight
+            ) == (
+                other.positive_integer, other.power_quantity, other.current_array, other.temperature,
+                other.eight_characters, other.time_quantity, other.voltage_array, other.weight
+            )
         )
 
+    @classmethod
+    def _dict_to_block(cls, value: Any, block_class: Union[Type[QuantityArrayBlock], Type[TimeSeriesBlock]]) -> Any:
+        """Converts a valid block dictionary to a block object so that the block is constructed only once.
+           In the attribute check, the dictionary would otherwise be converted once for the check and
+           once more for the actual attribute value. Other values are returned as they are."""
+        if isinstance(value, dict) and block_class.validate_json(value):
+            return block_class(**value)
+        return value
+
     # Provide a class method for each attribute added by this message type to check if the value is acceptable
     # These should return True only when the given parameter corresponds to an acceptable value for the attribute
     @classmethod
@@ -281,9 +293,9 @@ class ExampleMessage(AbstractResultMessage):
             return False
 
         for temperature_series_name in cls.TEMPERATURE_SERIES_NAMES:
-            if temperature_series_name not in block_series:
+            current_series = block_series.get(temperature_series_name, None)
+            if current_series is None:
                 return False
-            current_series = block_series[temperature_series_name]
             if current_series.unit_of_measure != cls.TEMPERATURE_SERIES_UNIT or len(current_series.values) < 3:
                 return False
 
@@ -291,6 +303,13 @@ class ExampleMessage(AbstractResultMessage):
 
     @classmethod
     def _check_voltage_array_block(cls, voltage_values: List[float]) -> bool:
+        if not voltage_values:
+            return True
+        # the builtin min and max functions handle the common case of valid values without a Python level loop
+        if -1000 < min(voltage_values) and max(voltage_values) < 1000:
+            return True
+
+        # the explicit loop gives the correct result also if the first value is NaN
         for voltage_value in voltage_values:
             if voltage_value <= -1000 or voltage_value >= 1000:
                 return False
@@ -303,17 +322,22 @@ class ExampleMessage(AbstractResultMessage):
         if len(block_series) < 1:
             return False
 
-        for _, series_attribute in block_series.items():
-            if series_attribute.unit_of_measure not in cls.ALLOWED_WEIGHT_UNITS:
-                return False
-
-        return True
+        allowed_weight_units = cls.ALLOWED_WEIGHT_UNITS
+        return all(
+            series_attribute.unit_of_measure in allowed_weight_units
+            for series_attribute in block_series.values()
+        )
 
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[ExampleMessage, None]:
-        if cls.validate_json(json_message):
+        """Returns a class object created based on the given JSON attributes.
+           If the given JSON does not contain valid values, returns None.
+           The constructor checks all the attributes, so they are not validated separately beforehand."""
+        try:
             return cls(**json_message)
-        return None
+        except (MessageError, TypeError, ValueError) as message_error:
+            LOGGER.warning("Could not create %s from the given JSON: %s", cls.__name__, message_error)
+            return None
 
 
 ExampleMessage.register_to_factory()
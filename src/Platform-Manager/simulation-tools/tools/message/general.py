@@ -15,6 +15,26 @@ from tools.tools import FullLogger
 
 LOGGER = FullLogger(__name__)
 
+# cache for whether the values of a type have a json method, the attribute values typically have only a few types
+_TYPE_HAS_JSON_FUNCTION = {}  # type: Dict[type, bool]
+
+
+def _add_attributes_to_json(message_json: Dict[str, Any], attributes: Dict[str, Any]):
+    """Adds the given attributes to the given JSON object. For the values that have a json method,
+       the result of that method is used as the value instead."""
+    type_has_json_function = _TYPE_HAS_JSON_FUNCTION
+    for attribute_name, attribute_value in attributes.items():
+        value_type = type(attribute_value)
+        has_json_function = type_has_json_function.get(value_type, None)
+        if has_json_function is None:
+            has_json_function = getattr(value_type, "json", None) is not None
+            type_has_json_function[value_type] = has_json_function
+
+        if has_json_function:
+            message_json[attribute_name] = attribute_value.json()
+        else:
+            message_json[attribute_name] = attribute_value
+
 
 class GeneralMessage(BaseMessage):
     """Class for a generic message containing at least all the required attributes from BaseMessage.
@@ -38,10 +58,12 @@ class GeneralMessage(BaseMessage):
         """
         super().__init__(**kwargs)
 
+        # the order of the attributes is kept, so the class attribute is only bound to a local name
+        message_attributes = self.__class__.MESSAGE_ATTRIBUTE_NAMES_FULL
         self.general_attributes = {
             general_attribute_name: general_attribute_value
             for general_attribute_name, general_attribute_value in kwargs.items()
-            if general_attribute_name not in self.__class__.MESSAGE_ATTRIBUTES_FULL
+            if general_attribute_name not in message_attributes
         }
 
     @property
@@ -52,8 +74,7 @@ class GeneralMessage(BaseMessage):
     @general_attributes.setter
     def general_attributes(self, general_attributes: dict):
         if not self._check_general_attributes(general_attributes):
-            raise MessageValueError("'{:s}' is an invalid general attribute dictionary".format(
-                str(general_attributes)))
+            raise MessageValueError(f"'{general_attributes}' is an invalid general attribute dictionary")
 
         self.__general_attributes = general_attributes
 
@@ -75,14 +96,10 @@ class GeneralMessage(BaseMessage):
 
     def json(self) -> Dict[str, Any]:
         """Returns the message as a JSON object."""
-        general_attributes_json = {}
-        for attribute_name, attribute_value in self.general_attributes.items():
-            if getattr(attribute_value, "json", None) is None:
-                general_attributes_json[attribute_name] = attribute_value
-            else:
-                general_attributes_json[attribute_name] = attribute_value.json()
-
-        return {**get_json(self), **general_attributes_json}
+        # the additional attributes are added directly to the JSON object created for the known attributes
+        message_json = get_json(self)
+        _add_attributes_to_json(message_json, self.general_attributes)
+        return message_json
 
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[GeneralMessage, None]:
@@ -113,10 +130,12 @@ class ResultMessage(AbstractResultMessage):
         """
         super().__init__(**kwargs)
 
+        # the order of the attributes is kept, so the class attribute is only bound to a local name
+        message_attributes = self.__class__.MESSAGE_ATTRIBUTE_NAMES_FULL
         self.result_values = {
             value_attribute_name: value_attribute_value
             for value_attribute_name, value_attribute_value in kwargs.items()
-            if value_attribute_name not in self.__class__.MESSAGE_ATTRIBUTES_FULL
+            if value_attribute_name not in message_attributes
         }
 
     @property
@@ -127,7 +146,7 @@ class ResultMessage(AbstractResultMessage):
     @result_values.setter
     def result_values(self, result_values: Dict[str, Any]):
         if not self._check_result_values(result_values):
-            raise MessageValueError("'{:s}' is an invalid result value dictionary".format(str(result_values)))
+            raise MessageValueError(f"'{result_values}' is an invalid result value dictionary")
 
         self.__result_values = result_values
 
@@ -144,14 +163,10 @@ class ResultMessage(AbstractResultMessage):
 
     def json(self) -> Dict[str, Any]:
         """Returns the message as a JSON object."""
-        result_values_json = {}
-        for result_name, result_value in self.result_values.items():
-            if getattr(result_value, "json", None) is None:
-                result_values_json[result_name] = result_value
-            else:
-                result_values_json[result_name] = result_value.json()
-
-        return {**get_json(self), **result_values_json}
+        # the additional attributes are added directly to the JSON object created for the known attributes
+        message_json = get_json(self)
+        _add_attributes_to_json(message_json, self.result_values)
+        return message_json
 
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[ResultMessage, None]:
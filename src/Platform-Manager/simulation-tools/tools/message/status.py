@@ -28,6 +28,8 @@ class StatusMessage(AbstractResultMessage):
     OPTIONAL_ATTRIBUTES = ["Description"]  # Description SHOULD be used if status value is "error"
 
     STATUS_VALUES = ["ready", "error"]
+    # set version of the allowed status values for the validity checks
+    STATUS_VALUE_SET = frozenset(STATUS_VALUES)
 
     MESSAGE_ATTRIBUTES_FULL = {
         **AbstractResultMessage.MESSAGE_ATTRIBUTES_FULL,
@@ -44,7 +46,7 @@ class StatusMessage(AbstractResultMessage):
 
         # Give a warning if an error message is created without a description.
         if self.value == self.__class__.STATUS_VALUES[-1] and not self.description:
-            LOGGER.info("No description for a message with status: '{:s}'".format(self.value))
+            LOGGER.info("No description for a message with status: '%s'", self.value)
 
     @property
     def value(self) -> str:
@@ -81,7 +83,7 @@ class StatusMessage(AbstractResultMessage):
 
     @classmethod
     def _check_value(cls, value: str) -> bool:
-        return isinstance(value, str) and value in cls.STATUS_VALUES
+        return isinstance(value, str) and value in cls.STATUS_VALUE_SET
 
     @classmethod
     def _check_description(cls, description: Union[str, None]) -> bool:
@@ -8,8 +8,14 @@
 
 import datetime
 import json
+import os
+import pathlib
 import random
+import shutil
 import string
+import subprocess
+import sys
+import tempfile
 from typing import Dict, Generator, List, Union, cast
 import unittest
 
@@ -18,6 +24,37 @@ from tools.exceptions.messages import MessageDateError, MessageValueError, Messa
 from tools.message.unit import UnitCode
 from tools.message.block import ValueArrayBlock, TimeSeriesBlock, QuantityArrayBlock
 
+# A replacement for NodeJS that implements the validator protocol and records its command line arguments.
+# The unit codes starting with "z" are invalid and all the other codes cause an error.
+# When broken is set, the process stops without answering when it should read from the standard input.
+FAKE_VALIDATOR_SCRIPT = '''#!{python}
+import json
+import sys
+with open({call_log!r}, "a", encoding="UTF-8") as call_log:
+    call_log.write(json.dumps(sys.argv[2]) + "\\n")
+
+def validate(unit_code):
+    return "invalid;" if unit_code.startswith("z") else "error;"
+
+if sys.argv[2] == "--stdin":
+    if {broken!r}:
+        sys.exit(1)
+    for line in sys.stdin:
+        print(validate(line.rstrip("\\n")), flush=True)
+else:
+    print(validate(sys.argv[2]))
+'''
+
+
+def is_ucum_validator_available() -> bool:
+    """Returns True if NodeJS and the ucum-lhc library needed by the JavaScript validator are available."""
+    if shutil.which(UnitCode.JAVASCRIPT_SYSTEM_CALL) is None:
+        return False
+    check_result = subprocess.run(
+        [UnitCode.JAVASCRIPT_SYSTEM_CALL, "-e", "require.resolve('@lhncbc/ucum-lhc')"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return check_result.returncode == 0
+
 
 def get_unit_code() -> Generator[str, None, None]:
     """Returns a unit code."""
@@ -90,6 +127,100 @@ class TestUnitCode(unittest.TestCase):
             with self.subTest(invalid_code=invalid_code):
                 self.assertFalse(UnitCode.is_valid(invalid_code))
 
+    @unittest.skipUnless(is_ucum_validator_available(), "NodeJS and the ucum-lhc library are required")
+    def test_validator_stream(self):
+        """Unit test for getting the same results from the validator process as from the single code calls."""
+        javascript_validator = str(next(pathlib.Path(".").glob(
+            "/".join(["**", UnitCode.UNIT_CODE_FILE_PATH, UnitCode.JAVASCRIPT_VALIDATOR]))))
+        unit_codes = ["m", "kV.A{r}", "m3/s", "invalid", "mmmm", "", "{", "kg/(m.s2)", "Cel", "10*3.[ft_i]"]
+
+        stream_result = subprocess.run(
+            [UnitCode.JAVASCRIPT_SYSTEM_CALL, javascript_validator, UnitCode.JAVASCRIPT_STREAM_ARGUMENT],
+            input="".join(unit_code + "\n" for unit_code in unit_codes), stdout=subprocess.PIPE,
+            check=True, encoding="UTF-8")
+        stream_outputs = stream_result.stdout.splitlines()
+        self.assertEqual(len(stream_outputs), len(unit_codes))
+
+        for unit_code, stream_output in zip(unit_codes, stream_outputs):
+            with self.subTest(unit_code=unit_code):
+                single_result = subprocess.run(
+                    [UnitCode.JAVASCRIPT_SYSTEM_CALL, javascript_validator, unit_code],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, check=True, encoding="UTF-8")
+                self.assertEqual(stream_output.strip(), single_result.stdout.strip())
+
+
+class TestUnitCodeValidatorProcess(unittest.TestCase):
+    """Unit tests for the use of the long-running validator process in the UnitCode class."""
+
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.call_log = os.path.join(self.temp_folder.name, "calls.txt")
+        self.unit_code_classes = []  # type: List[type]
+        self.clear_invalid_unit_codes()
+
+    def tearDown(self):
+        for unit_code_class in self.unit_code_classes:
+            # stop the validator process the same way as at the program exit
+            unit_code_class._UnitCode__stop_validator_process()  # pylint: disable=protected-access
+        self.temp_folder.cleanup()
+        # the fake validator results should not affect the other tests
+        self.clear_invalid_unit_codes()
+
+    @staticmethod
+    def clear_invalid_unit_codes():
+        """Removes the remembered invalid unit codes that are shared by UnitCode and its subclasses."""
+        UnitCode._UnitCode__INVALID_UNIT_CODES.clear()  # pylint: disable=protected-access
+
+    def get_unit_code_class(self, broken: bool = False) -> type:
+        """Returns a UnitCode subclass that uses a fake validator instead of NodeJS."""
+        fake_node = os.path.join(self.temp_folder.name, "fake_node_{}".format(len(self.unit_code_classes)))
+        with open(fake_node, "w", encoding="UTF-8") as fake_node_file:
+            fake_node_file.write(
+                FAKE_VALIDATOR_SCRIPT.format(python=sys.executable, call_log=self.call_log, broken=broken))
+        os.chmod(fake_node, 0o755)
+
+        # the subclass starts its own validator process even if the process has failed for the UnitCode class
+        unit_code_class = type("FakeUnitCode", (UnitCode, ), {
+            "JAVASCRIPT_SYSTEM_CALL": fake_node,
+            "_UnitCode__VALIDATOR_PROCESS": None,
+            "_UnitCode__VALIDATOR_PROCESS_FAILED": False
+        })
+        self.unit_code_classes.append(unit_code_class)
+        return unit_code_class
+
+    def get_calls(self) -> List[str]:
+        """Returns the command line argument following the validator filename for each fake validator call."""
+        if not os.path.exists(self.call_log):
+            return []
+        with open(self.call_log, "r", encoding="UTF-8") as call_log:
+            return [json.loads(line) for line in call_log]
+
+    def test_validator_process(self):
+        """Unit test for validating several unit codes with a single validator process."""
+        unit_code_class = self.get_unit_code_class()
+        for unit_code in ["zz_process_1", "zz_process_2", "error_process_1", "error_process_1"]:
+            with self.subTest(unit_code=unit_code):
+                self.assertFalse(unit_code_class.is_valid(unit_code))
+
+        # the invalid codes are remembered, the error results are not
+        self.assertFalse(unit_code_class.is_valid("zz_process_1"))
+        self.assertEqual(self.get_calls(), [UnitCode.JAVASCRIPT_STREAM_ARGUMENT])
+
+        # a code with a line break is validated with a separate call
+        self.assertFalse(unit_code_class.is_valid("zz_process\n3"))
+        self.assertEqual(self.get_calls(), [UnitCode.JAVASCRIPT_STREAM_ARGUMENT, "zz_process\n3"])
+
+    def test_broken_validator_process(self):
+        """Unit test for using separate validator calls when the validator process does not work."""
+        unit_code_class = self.get_unit_code_class(broken=True)
+        self.assertFalse(unit_code_class.is_valid("zz_broken_1"))
+        self.assertFalse(unit_code_class.is_valid("zz_broken_2"))
+        self.assertFalse(unit_code_class.is_valid("zz_broken_1"))
+
+        # the validator process is tried only once
+        self.assertEqual(
+            self.get_calls(), [UnitCode.JAVASCRIPT_STREAM_ARGUMENT, "zz_broken_1", "zz_broken_2"])
+
 
 class TestValueArrayBlock(unittest.TestCase):
     """Unit tests for the ValueArrayBlock class."""
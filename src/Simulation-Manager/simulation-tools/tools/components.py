@@ -15,6 +15,7 @@ from tools.clients import RabbitmqClient
 from tools.exceptions.messages import MessageError
 from tools.messages import (
     BaseMessage, AbstractMessage, EpochMessage, StatusMessage, SimulationStateMessage, MessageGenerator)
+from tools.message.unit import UnitCode
 from tools.tools import FullLogger, EnvironmentVariable
 
 LOGGER = FullLogger(__name__)
@@ -255,6 +256,8 @@ class AbstractSimulationComponent:
         LOGGER.info("Stopping the component: '{}'".format(self.component_name))
         self._simulation_state = AbstractSimulationComponent.SIMULATION_STATE_VALUE_STOPPED
         await self._rabbitmq_client.close()
+        # write the learned unit codes here since the exit handlers are not run if the container is terminated
+        UnitCode.write_new_unit_codes()
         self._is_stopped = True
 
     def get_simulation_state(self) -> str:
@@ -37,7 +37,7 @@ def get_json(message_object: BaseMessage) -> Dict[str, Any]:
             else getattr(message_object, object_attribute_name).json()
         )
         for json_attribute_name, object_attribute_name in message_object.__class__.MESSAGE_ATTRIBUTES_FULL.items()
-        if (json_attribute_name not in message_object.__class__.OPTIONAL_ATTRIBUTES_FULL or
+        if (json_attribute_name not in message_object.__class__.OPTIONAL_ATTRIBUTE_NAMES_FULL or
             getattr(message_object, object_attribute_name) is not None)
     }
 
@@ -50,7 +50,7 @@ def validate_json(message_class: Type[BaseMessage], json_message: Dict[str, Any]
             continue
 
         if (json_attribute_name not in json_message and
-                json_attribute_name not in message_class.OPTIONAL_ATTRIBUTES_FULL):
+                json_attribute_name not in message_class.OPTIONAL_ATTRIBUTE_NAMES_FULL):
             LOGGER.warning("{:s} attribute is missing from the message".format(json_attribute_name))
             return False
 
@@ -98,9 +98,19 @@ class BaseMessage():
     QUANTITY_BLOCK_ATTRIBUTES_FULL = QUANTITY_BLOCK_ATTRIBUTES
     QUANTITY_ARRAY_BLOCK_ATTRIBUTES_FULL = QUANTITY_ARRAY_BLOCK_ATTRIBUTES
     TIMESERIES_BLOCK_ATTRIBUTES_FULL = TIMESERIES_BLOCK_ATTRIBUTES
+    # Frozen sets of the JSON attribute names for the membership checks.
+    # These are generated automatically for each subclass from the full attribute definitions above.
+    MESSAGE_ATTRIBUTE_NAMES_FULL = frozenset(MESSAGE_ATTRIBUTES_FULL)
+    OPTIONAL_ATTRIBUTE_NAMES_FULL = frozenset(OPTIONAL_ATTRIBUTES_FULL)
 
     DEFAULT_SIMULATION_ID = "2000-01-01T00:00:00.000Z"
 
+    def __init_subclass__(cls, **kwargs):
+        """Generates the attribute name sets from the full attribute definitions of the new message class."""
+        super().__init_subclass__(**kwargs)
+        cls.MESSAGE_ATTRIBUTE_NAMES_FULL = frozenset(cls.MESSAGE_ATTRIBUTES_FULL)
+        cls.OPTIONAL_ATTRIBUTE_NAMES_FULL = frozenset(cls.OPTIONAL_ATTRIBUTES_FULL)
+
     def __init__(self, **kwargs):
         """Only arguments in MESSAGE_ATTRIBUTES_FULL of the message class are considered.
            If Timestamp is missing, it is added with a value corresponding to the current time.
@@ -505,6 +515,8 @@ class AbstractResultMessage(AbstractMessage):
         "intermediate",
         "final"
     ]
+    # set version of the allowed iteration status values for the validity checks
+    ITERATION_STATUS_VALUE_SET = frozenset(ITERATION_STATUS_VALUES)
 
     @property
     def epoch_number(self) -> int:
@@ -618,7 +630,8 @@ class AbstractResultMessage(AbstractMessage):
 
     @classmethod
     def _check_iteration_status(cls, iteration_status: Optional[str]) -> bool:
-        return iteration_status is None or iteration_status in cls.ITERATION_STATUS_VALUES
+        return iteration_status is None or (
+            isinstance(iteration_status, str) and iteration_status in cls.ITERATION_STATUS_VALUE_SET)
 
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[AbstractResultMessage, None]:
@@ -7,8 +7,9 @@
 """This module contains general utils for working with simulation platform message classes."""
 
 import datetime
-from typing import Iterator, List, Optional, Type, Union
+from typing import Callable, Dict, Iterator, List, Optional, Type, Union
 
+from tools.datetime_tools import get_utcnow_in_milliseconds
 from tools.exceptions.messages import MessageError
 from tools.message.abstract import AbstractMessage
 from tools.message.epoch import EpochMessage
@@ -42,9 +43,21 @@ class MessageGenerator:
     """Message generator class to help with the creation of simulation message objects."""
     def __init__(self, simulation_id: str, source_process_id: str, start_message_id: int = 1):
         # TODO: add checks for the parameters
+        # the message attributes are given directly to the message constructors which also check them
+        self._simulation_id = simulation_id
+        self._source_process_id = source_process_id
         self._message_id_generator = get_next_message_id(source_process_id, start_message_id)
-        self._abstract_message_generator = abstract_message_generator(
-            self._message_id_generator, simulation_id, source_process_id)
+
+        # the message creation methods for the message classes and status values that have a specific method
+        self._message_class_functions = {
+            EpochMessage: self.get_epoch_message,
+            StatusMessage: self.get_status_message,
+            SimulationStateMessage: self.get_simulation_state_message
+        }  # type: Dict[Type[AbstractMessage], Callable[..., AbstractMessage]]
+        self._status_value_functions = {
+            StatusMessage.STATUS_VALUES[0]: self.get_status_ready_message,   # should be "ready"
+            StatusMessage.STATUS_VALUES[-1]: self.get_status_error_message   # should be "error"
+        }  # type: Dict[str, Callable[..., StatusMessage]]
 
     @property
     def message_id_generator(self) -> Iterator[str]:
@@ -52,20 +65,23 @@ class MessageGenerator:
         return self._message_id_generator
 
     def get_abstract_message(self) -> AbstractMessage:
-        """Returns a new AbstractMessage instance."""
-        return next(self._abstract_message_generator)
+        """Returns a new AbstractMessage instance.
+           The other message creation methods do not use this, but they share the same message id generator."""
+        return AbstractMessage(
+            Type=AbstractMessage.CLASS_MESSAGE_TYPE,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator)
+        )
 
     def get_message(self, message_class: Type[AbstractMessage], **kwargs) -> AbstractMessage:
         """Returns a new message instance of type message_class according to the given parameters.
            Throws an MessageError or ValueError exception if there is a problem with the given parameters.
         """
         # TODO: add unit tests for this function
-        if message_class is EpochMessage:
-            return self.get_epoch_message(**kwargs)
-        if message_class is StatusMessage:
-            return self.get_status_message(**kwargs)
-        if message_class is SimulationStateMessage:
-            return self.get_simulation_state_message(**kwargs)
+        message_class_function = self._message_class_functions.get(message_class, None)
+        if message_class_function is not None:
+            return message_class_function(**kwargs)
 
         if not issubclass(message_class, AbstractMessage):
             raise MessageError("{:s} is not a subclass of {:s}".format(
@@ -74,13 +90,12 @@ class MessageGenerator:
         # No predefined function for the given message class type.
         # => Argument checking is done by the message class but no error messages related to extra arguments
         #    are given as in the other cases.
-        abstract_message = self.get_abstract_message()
         return message_class(
             Type=message_class.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             **kwargs
         )
 
@@ -92,13 +107,12 @@ class MessageGenerator:
         """Returns a new EpochMessage corresponding to the given parameters.
            Throws an exception if the message creation was unsuccessful."""
         # pylint: disable=invalid-name
-        abstract_message = self.get_abstract_message()
         return EpochMessage(
             Type=EpochMessage.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             EpochNumber=EpochNumber,
             TriggeringMessageIds=TriggeringMessageIds,
             LastUpdatedInEpoch=LastUpdatedInEpoch,
@@ -112,19 +126,18 @@ class MessageGenerator:
         """Returns a new StatusMessage corresponding to the given parameters.
            Throws an exception if the message creation was unsuccessful."""
         # pylint: disable=invalid-name
-        if Value == StatusMessage.STATUS_VALUES[0]:   # should be "ready"
-            return self.get_status_ready_message(**kwargs)
-        if Value == StatusMessage.STATUS_VALUES[-1]:  # should be "error"
-            return self.get_status_error_message(**kwargs)
+        if isinstance(Value, str):
+            status_value_function = self._status_value_functions.get(Value, None)
+            if status_value_function is not None:
+                return status_value_function(**kwargs)
 
         # unknown status value, try to create the message regardless
-        abstract_message = self.get_abstract_message()
         return StatusMessage(
             Type=StatusMessage.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             Value=Value,
             **kwargs
         )
@@ -135,13 +148,12 @@ class MessageGenerator:
         """Returns a new StatusMessage corresponding to the given parameters.
            Throws an exception if the message creation was unsuccessful."""
         # pylint: disable=invalid-name
-        abstract_message = self.get_abstract_message()
         return StatusMessage(
             Type=StatusMessage.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             EpochNumber=EpochNumber,
             TriggeringMessageIds=TriggeringMessageIds,
             LastUpdatedInEpoch=LastUpdatedInEpoch,
@@ -157,13 +169,12 @@ class MessageGenerator:
         """Returns a new StatusMessage corresponding to the given parameters.
            Throws an exception if the message creation was unsuccessful."""
         # pylint: disable=invalid-name
-        abstract_message = self.get_abstract_message()
         return StatusMessage(
             Type=StatusMessage.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             EpochNumber=EpochNumber,
             TriggeringMessageIds=TriggeringMessageIds,
             LastUpdatedInEpoch=LastUpdatedInEpoch,
@@ -178,13 +189,12 @@ class MessageGenerator:
         """Returns a new StatusMessage corresponding to the given parameters.
            Throws an exception if the message creation was unsuccessful."""
         # pylint: disable=invalid-name
-        abstract_message = self.get_abstract_message()
         return SimulationStateMessage(
             Type=SimulationStateMessage.CLASS_MESSAGE_TYPE,
-            SimulationId=abstract_message.simulation_id,
-            SourceProcessId=abstract_message.source_process_id,
-            MessageId=abstract_message.message_id,
-            Timestamp=abstract_message.timestamp,
+            SimulationId=self._simulation_id,
+            SourceProcessId=self._source_process_id,
+            MessageId=next(self._message_id_generator),
+            Timestamp=get_utcnow_in_milliseconds(),
             SimulationState=SimulationState,
             Name=Name,
             Description=Description
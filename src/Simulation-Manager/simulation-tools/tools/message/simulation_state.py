@@ -9,7 +9,7 @@
 from __future__ import annotations
 from typing import Any, Dict, Union
 
-from tools.exceptions.messages import MessageStateValueError, MessageValueError
+from tools.exceptions.messages import MessageError, MessageStateValueError, MessageValueError
 from tools.message.abstract import AbstractMessage
 from tools.tools import FullLogger
 
@@ -21,6 +21,10 @@ class SimulationStateMessage(AbstractMessage):
     CLASS_MESSAGE_TYPE = "SimState"
     MESSAGE_TYPE_CHECK = True
 
+    # the simulation state specific attributes are stored in slots, the parent classes still provide an instance
+    # dictionary since the other message attributes are set dynamically by name
+    __slots__ = ("__simulation_state", "__name", "__description")
+
     MESSAGE_ATTRIBUTES = {
         "SimulationState": "simulation_state",
         "Name": "name",
@@ -38,6 +42,8 @@ class SimulationStateMessage(AbstractMessage):
         "running",
         "stopped"
     ]
+    # set version of the allowed simulation states for the validity checks
+    SIMULATION_STATE_SET = frozenset(SIMULATION_STATES)
 
     @property
     def simulation_state(self) -> str:
@@ -84,7 +90,7 @@ class SimulationStateMessage(AbstractMessage):
 
     @classmethod
     def _check_simulation_state(cls, simulation_state: str) -> bool:
-        return simulation_state in cls.SIMULATION_STATES
+        return isinstance(simulation_state, str) and simulation_state in cls.SIMULATION_STATE_SET
 
     @classmethod
     def _check_name(cls, name: Union[str, None]) -> bool:
@@ -97,10 +103,13 @@ class SimulationStateMessage(AbstractMessage):
     @classmethod
     def from_json(cls, json_message: Dict[str, Any]) -> Union[SimulationStateMessage, None]:
         """Returns a class object created based on the given JSON attributes.
-           If the given JSON does not contain valid values, returns None."""
-        if cls.validate_json(json_message):
+           If the given JSON does not contain valid values, returns None.
+           The constructor checks all the attributes, so they are not validated separately beforehand."""
+        try:
             return cls(**json_message)
-        return None
+        except (MessageError, TypeError, ValueError) as message_error:
+            LOGGER.warning("Could not create %s from the given JSON: %s", cls.__name__, message_error)
+            return None
 
 
 SimulationStateMessage.register_to_factory()
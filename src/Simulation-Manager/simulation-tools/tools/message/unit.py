@@ -7,10 +7,14 @@
 """This module contains tools for dealing with UCUM unit codes."""
 
 from __future__ import annotations
+import atexit
+import collections
 import csv
 import pathlib
 import subprocess
-from typing import Dict, Union
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
 
 from tools.tools import FullLogger
 
@@ -26,25 +30,58 @@ class UnitCode:
     UNIT_CODE_FILE_COLUMN_SEPARATOR = ";"
     UNIT_CODE_FILE_CODE_COLUMN = "Code"
     UNIT_CODE_FILE_DESCRIPTION_COLUMN = "Description"
+    # The number of new unit codes that are collected before they are written to the unit code file and
+    # the maximum time in seconds that a new unit code is kept before it is written with the next new code.
+    # Any remaining new unit codes are written when a simulation component stops or when the program exits.
+    UNIT_CODE_FILE_WRITE_BATCH_SIZE = 20
+    UNIT_CODE_FILE_WRITE_INTERVAL = 10.0
 
     # Name of the Javascript UCUM unit code validator.
     # The use of the validator requires that NodeJS is installed in the system.
     JAVASCRIPT_VALIDATOR = "validator.js"
     JAVASCRIPT_SYSTEM_CALL = "node"
+    # With this argument the validator reads unit codes from the standard input, one code per line,
+    # and writes the result for each code to the standard output on its own line.
+    JAVASCRIPT_STREAM_ARGUMENT = "--stdin"
     VALIDATOR_VALID_TEXT = "valid"
+    VALIDATOR_INVALID_TEXT = "invalid"
     VALIDATOR_RESULT_SEPARATOR = ";"
+    VALIDATOR_PROCESS_STOP_TIMEOUT = 5.0
 
-    UNIT_CODE_LIST = {}
+    # The known valid unit codes with their descriptions, loaded from the unit code files at the first use.
+    UNIT_CODE_LIST = None  # type: Optional[Dict[str, str]]
+    __UNIT_CODE_LIST_LOCK = threading.Lock()
+
+    # The maximum number of unit codes found invalid by the validator that are remembered.
+    INVALID_UNIT_CODE_CACHE_SIZE = 4096
+    # The unit codes found invalid by the validator, with the most recently seen code at the end.
+    __INVALID_UNIT_CODES = collections.OrderedDict()  # type: collections.OrderedDict[str, None]
+    __INVALID_UNIT_CODES_LOCK = threading.Lock()
+
+    # The found resource file paths, the glob search through the directory tree is done only once for each file.
+    __RESOURCE_FILENAMES = {}  # type: Dict[Tuple[str, str], Union[str, None]]
+    # The new unit codes, with descriptions, that have not yet been written to the unit code file.
+    __NEW_UNIT_CODES = []  # type: List[Tuple[str, str]]
+    __NEW_UNIT_CODES_START_TIME = 0.0
+
+    # The long-running validator process that is started at the first unit code that needs the validator.
+    __VALIDATOR_PROCESS = None  # type: Optional[subprocess.Popen]
+    __VALIDATOR_PROCESS_FAILED = False
+    __VALIDATOR_LOCK = threading.Lock()
 
     @classmethod
     def is_valid(cls, unit_code: str) -> bool:
         """Returns True if unit_code is a valid UCUM code."""
-        if not cls.UNIT_CODE_LIST:
-            cls.UNIT_CODE_LIST = cls.__return_unit_code_list()
+        unit_code_list = cls.__get_unit_code_list()
 
         # Check against the preloaded unit codes.
-        if unit_code in cls.UNIT_CODE_LIST:
+        if unit_code in unit_code_list:
             return True
+        # Check against the unit codes that the validator has already found invalid.
+        with cls.__INVALID_UNIT_CODES_LOCK:
+            if unit_code in cls.__INVALID_UNIT_CODES:
+                cls.__INVALID_UNIT_CODES.move_to_end(unit_code)
+                return False
 
         # Use Javascript library ucum-lhc to validate the unit code.
         javascript_validator = cls.__find_resource_filename(cls.UNIT_CODE_FILE_PATH, cls.JAVASCRIPT_VALIDATOR)
@@ -52,25 +89,32 @@ class UnitCode:
             # Could not find the JavaScript validator file and the given unit code was not in the premade lists.
             return False
         try:
-            validator_result = subprocess.run([cls.JAVASCRIPT_SYSTEM_CALL, javascript_validator, unit_code],
-                                              check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            validator_output = validator_result.stdout.decode("UTF-8").strip()
+            validator_output = cls.__run_validator(javascript_validator, unit_code).strip()
 
             # The output from the Javascript validator should be <validator_text>;<unit_description>
             output_parts = validator_output.split(cls.VALIDATOR_RESULT_SEPARATOR)
-            LOGGER.debug("Result UCUM unit validator: {:s} -> {:s}".format(unit_code, output_parts[0]))
+            LOGGER.debug("Result UCUM unit validator: %s -> %s", unit_code, output_parts[0])
+            if output_parts[0] == cls.VALIDATOR_INVALID_TEXT:
+                # only an explicit invalid result is remembered, the other results can be caused by temporary errors
+                with cls.__INVALID_UNIT_CODES_LOCK:
+                    cls.__INVALID_UNIT_CODES[unit_code] = None
+                    if len(cls.__INVALID_UNIT_CODES) > cls.INVALID_UNIT_CODE_CACHE_SIZE:
+                        cls.__INVALID_UNIT_CODES.popitem(last=False)
+                return False
             if output_parts[0] != cls.VALIDATOR_VALID_TEXT:
+                LOGGER.warning("Unexpected result '%s' from the validator for unit code: %s",
+                               validator_output, unit_code)
                 return False
 
             unit_description = cls.VALIDATOR_RESULT_SEPARATOR.join(output_parts[1:])
-            cls.UNIT_CODE_LIST[unit_code] = unit_description
+            unit_code_list[unit_code] = unit_description
             cls.__add_new_unit_code(unit_code, unit_description)
             return True
 
         except subprocess.CalledProcessError as error:
-            LOGGER.warning("CalledProcessError '{}' when trying to validate unit code: {:s}".format(error, unit_code))
+            LOGGER.warning("CalledProcessError '%s' when trying to validate unit code: %s", error, unit_code)
         except OSError as error:
-            LOGGER.warning("OSError '{}' when trying to validate unit code: {:s}".format(error, unit_code))
+            LOGGER.warning("OSError '%s' when trying to validate unit code: %s", error, unit_code)
 
         # An error occurred while trying to use the JavaScript validator and
         # the given unit code was not in the premade lists.
@@ -79,18 +123,89 @@ class UnitCode:
     @classmethod
     def get_description(cls, unit_code: str) -> Union[str, None]:
         """Returns the description for the given unit code. Return None if the code is not valid."""
-        if not cls.UNIT_CODE_LIST:
-            cls.UNIT_CODE_LIST = cls.__return_unit_code_list()
+        return cls.__get_unit_code_list().get(unit_code, None)
+
+    @classmethod
+    def __get_unit_code_list(cls) -> Dict[str, str]:
+        """Returns the known unit codes. The unit code files are read only once, also with concurrent callers."""
+        if cls.UNIT_CODE_LIST is None:
+            with cls.__UNIT_CODE_LIST_LOCK:
+                if cls.UNIT_CODE_LIST is None:
+                    cls.UNIT_CODE_LIST = cls.__return_unit_code_list()
 
-        return cls.UNIT_CODE_LIST.get(unit_code, None)
+        return cls.UNIT_CODE_LIST
+
+    @classmethod
+    def __run_validator(cls, javascript_validator: str, unit_code: str) -> str:
+        """
+        Returns the output from the JavaScript validator for the given unit code.
+        The long-running validator process is used when possible, otherwise a new process is started for the code.
+        """
+        # the validator process reads the codes line by line, so a line break cannot be a part of the code
+        if not cls.__VALIDATOR_PROCESS_FAILED and "\n" not in unit_code and "\r" not in unit_code:
+            with cls.__VALIDATOR_LOCK:
+                validator_output = cls.__query_validator_process(javascript_validator, unit_code)
+            if validator_output is not None:
+                return validator_output
+
+        validator_result = subprocess.run([cls.JAVASCRIPT_SYSTEM_CALL, javascript_validator, unit_code],
+                                          check=True, stdin=subprocess.DEVNULL,
+                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return validator_result.stdout.decode("UTF-8")
+
+    @classmethod
+    def __query_validator_process(cls, javascript_validator: str, unit_code: str) -> Optional[str]:
+        """
+        Returns the output from the long-running validator process for the given unit code.
+        Returns None if the process could not be used. In that case, the process is not tried again.
+        """
+        try:
+            if cls.__VALIDATOR_PROCESS is None:
+                cls.__VALIDATOR_PROCESS = subprocess.Popen(
+                    [cls.JAVASCRIPT_SYSTEM_CALL, javascript_validator, cls.JAVASCRIPT_STREAM_ARGUMENT],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, encoding="UTF-8")
+                atexit.register(cls.__stop_validator_process)
+
+            cls.__VALIDATOR_PROCESS.stdin.write(unit_code + "\n")
+            cls.__VALIDATOR_PROCESS.stdin.flush()
+            validator_output = cls.__VALIDATOR_PROCESS.stdout.readline()
+            if validator_output:
+                return validator_output
+            LOGGER.warning("The unit code validator process stopped unexpectedly")
+
+        except OSError as error:
+            LOGGER.warning("OSError '%s' when trying to use the unit code validator process", error)
+
+        cls.__stop_validator_process()
+        cls.__VALIDATOR_PROCESS_FAILED = True
+        return None
+
+    @classmethod
+    def __stop_validator_process(cls):
+        """Stops the long-running validator process if it is running."""
+        atexit.unregister(cls.__stop_validator_process)
+        validator_process = cls.__VALIDATOR_PROCESS
+        if validator_process is None:
+            return
+        cls.__VALIDATOR_PROCESS = None
+
+        try:
+            # the validator process stops when its input is closed
+            validator_process.stdin.close()
+            validator_process.wait(timeout=cls.VALIDATOR_PROCESS_STOP_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            validator_process.kill()
+            validator_process.wait()
 
     @classmethod
     def __find_resource_filename(cls, resource_path, resource_file) -> Union[str, None]:
         """Returns the full path to the resource file or None if the file is not found."""
-        file_list = list(pathlib.Path(".").glob("/".join(["**", resource_path, resource_file])))
-        if file_list:
-            return "/".join(file_list[0].parts)
-        return None
+        resource_key = (resource_path, resource_file)
+        if resource_key not in cls.__RESOURCE_FILENAMES:
+            file_list = list(pathlib.Path(".").glob("/".join(["**", resource_path, resource_file])))
+            cls.__RESOURCE_FILENAMES[resource_key] = "/".join(file_list[0].parts) if file_list else None
+
+        return cls.__RESOURCE_FILENAMES[resource_key]
 
     @classmethod
     def __return_unit_code_list(cls) -> Dict[str, str]:
@@ -101,43 +216,74 @@ class UnitCode:
             # Use glob to find the resource file paths to allow code usage in a submodule.
             for unit_code_file in current_path.glob("/".join(["**", cls.UNIT_CODE_FILE_PATH, unit_code_file_name])):
                 try:
-                    with open(unit_code_file, mode="r") as csv_file:
-                        csv_reader = csv.DictReader(csv_file, delimiter=cls.UNIT_CODE_FILE_COLUMN_SEPARATOR)
-                        for csv_row in csv_reader:
-                            unit_code = csv_row[cls.UNIT_CODE_FILE_CODE_COLUMN]
-                            unit_description = csv_row[cls.UNIT_CODE_FILE_DESCRIPTION_COLUMN]
+                    with open(unit_code_file, mode="r", encoding="UTF-8", newline="") as csv_file:
+                        # use the column indexes from the header row instead of creating a dictionary for each row
+                        csv_reader = csv.reader(csv_file, delimiter=cls.UNIT_CODE_FILE_COLUMN_SEPARATOR)
+                        header_row = next(csv_reader, [])
+                        code_index = header_row.index(cls.UNIT_CODE_FILE_CODE_COLUMN)
+                        description_index = header_row.index(cls.UNIT_CODE_FILE_DESCRIPTION_COLUMN)
+                        minimum_row_length = max(code_index, description_index) + 1
 
-                            unit_code_dict[unit_code] = unit_description
+                        unit_code_dict.update(
+                            (csv_row[code_index], csv_row[description_index])
+                            for csv_row in csv_reader
+                            if len(csv_row) >= minimum_row_length
+                        )
 
-                except KeyError as key_error:
-                    LOGGER.error("KeyError '{:s}' while trying to read unit codes from file {:s}".format(
-                        str(key_error), unit_code_file))
+                except ValueError as value_error:
+                    # a required column was missing from the header row or the file was not valid UTF-8
+                    LOGGER.error("ValueError '%s' while trying to read unit codes from file %s",
+                                 value_error, unit_code_file)
 
                 except csv.Error as csv_error:
-                    LOGGER.error("csv.Error '{:s}' while trying to read unit codes from file {:s}".format(
-                        str(csv_error), unit_code_file))
+                    LOGGER.error("csv.Error '%s' while trying to read unit codes from file %s",
+                                 csv_error, unit_code_file)
 
                 except OSError as os_error:
-                    LOGGER.error("OSError '{:s}' while trying to read file {:s}".format(
-                        str(os_error), unit_code_file
-                    ))
+                    LOGGER.error("OSError '%s' while trying to read file %s", os_error, unit_code_file)
 
         return unit_code_dict
 
     @classmethod
     def __add_new_unit_code(cls, unit_code: str, unit_description: str):
-        """Adds a new unit code to the unit code file that is preloaded before the first validator query."""
+        """
+        Adds a new unit code to the list of unit codes that will be written to the unit code file
+        that is preloaded before the first validator query.
+        """
+        if not cls.__NEW_UNIT_CODES:
+            # make sure that the collected unit codes are written to the file also if the batch is not full
+            atexit.register(cls.write_new_unit_codes)
+            cls.__NEW_UNIT_CODES_START_TIME = time.monotonic()
+
+        cls.__NEW_UNIT_CODES.append((unit_code, unit_description))
+        if (len(cls.__NEW_UNIT_CODES) >= cls.UNIT_CODE_FILE_WRITE_BATCH_SIZE or
+                time.monotonic() - cls.__NEW_UNIT_CODES_START_TIME >= cls.UNIT_CODE_FILE_WRITE_INTERVAL):
+            cls.write_new_unit_codes()
+
+    @classmethod
+    def write_new_unit_codes(cls):
+        """
+        Writes the collected new unit codes to the unit code file with a single file operation.
+        Should be called before the program stops so that the learned unit codes are not lost.
+        """
+        atexit.unregister(cls.write_new_unit_codes)
+        if not cls.__NEW_UNIT_CODES:
+            return
+        new_unit_codes = cls.__NEW_UNIT_CODES
+        cls.__NEW_UNIT_CODES = []
 
         # find out the actual path of the unit code file to allow use when included as a submodule
-        unit_code_file_path = next(pathlib.Path(".").glob(
-            "/".join(["**", cls.UNIT_CODE_FILE_PATH, cls.UNIT_CODE_FILE_NAMES[0]])))
-        additional_file = "/".join(list(unit_code_file_path.parts[:-1]) + [cls.UNIT_CODE_FILE_NAMES[-1]])
+        unit_code_file_path = cls.__find_resource_filename(cls.UNIT_CODE_FILE_PATH, cls.UNIT_CODE_FILE_NAMES[0])
+        if unit_code_file_path is None:
+            LOGGER.error("Could not find the unit code file %s", cls.UNIT_CODE_FILE_NAMES[0])
+            return
+        additional_file = "/".join(
+            list(pathlib.Path(unit_code_file_path).parts[:-1]) + [cls.UNIT_CODE_FILE_NAMES[-1]])
 
         try:
             with open(additional_file, mode="a", encoding="UTF-8") as additional_unit_file:
-                additional_unit_file.write(cls.UNIT_CODE_FILE_COLUMN_SEPARATOR.join(
-                    [unit_code, unit_description]) + "\n")
+                additional_unit_file.writelines(
+                    cls.UNIT_CODE_FILE_COLUMN_SEPARATOR.join([unit_code, unit_description]) + "\n"
+                    for unit_code, unit_description in new_unit_codes)
         except OSError as os_error:
-            LOGGER.error("OSError '{:s}' while trying to write to file {:s}".format(
-                str(os_error), additional_file
-            ))
+            LOGGER.error("OSError '%s' while trying to write to file %s", os_error, additional_file)
@@ -13,7 +13,8 @@ import unittest
 
 import tools.exceptions.messages
 import tools.messages
-from tools.datetime_tools import to_utc_datetime_object
+from tools.datetime_tools import to_iso_format_datetime_string, to_utc_datetime_object
+from tools.message.epoch import _parse_utc_datetime_string, _to_epoch_time_string
 
 from tools.tests.messages_common import (
     MESSAGE_TYPE_ATTRIBUTE, TIMESTAMP_ATTRIBUTE, SIMULATION_ID_ATTRIBUTE, SOURCE_PROCESS_ID_ATTRIBUTE,
@@ -31,6 +32,39 @@ DEFAULT_TYPE = "Epoch"
 FULL_JSON = {**FULL_JSON, "Type": DEFAULT_TYPE}
 ALTERNATE_JSON = {**ALTERNATE_JSON, "Type": DEFAULT_TYPE}
 
+VALID_UTC_DATETIME_STRINGS = [
+    "2020-07-31T11:11:11Z",
+    "2020-07-31T11:11:11.123Z",
+    "2020-02-29T00:00:00Z",
+    "2021-12-31T23:59:59.999Z",
+    "0001-01-01T00:00:00.000Z"
+]
+OTHER_DATETIME_STRINGS = [
+    "2020-02-30T00:00:00Z",
+    "2021-02-29T00:00:00.000Z",
+    "2020-07-31T24:11:11.123Z",
+    "2020-13-01T00:00:00Z",
+    "2020-07-31T11:60:00Z",
+    "2020-07-31T11:11:61Z",
+    "0000-01-01T00:00:00Z",
+    "2020-07-3aT11:11:11Z",
+    "2020-07-31T11:11:11.12aZ",
+    "2020-07-31T11:11:11.+12Z",
+    "2020-07-31T11:11:1\u0661Z",
+    "2020/07/31T11:11:11Z",
+    "2020-07-31 11:11:11Z",
+    "2020-07-31T11-11-11Z",
+    "2020-07-31T11:11:11,123Z",
+    "2020-07-31T11:11:11+00",
+    "2020-07-31T11:11:11.123+00:00",
+    "2020-07-31T11:11:11.1Z",
+    "2020-07-31T11:11:11.123456Z",
+    "2020-07-31T11:11Z",
+    "2020-07-31",
+    "timestamp",
+    ""
+]
+
 
 class TestEpochMessage(unittest.TestCase):
     """Unit tests for the EpochMessage class."""
@@ -247,5 +281,42 @@ class TestEpochMessage(unittest.TestCase):
                         tools.messages.EpochMessage(**json_invalid_attribute)
 
 
+class TestEpochTimeParsing(unittest.TestCase):
+    """Unit tests for the fast parsing of the epoch start and end times."""
+
+    def assert_same_conversion(self, datetime_str: str):
+        """Asserts that the given string is converted in the same way as with to_iso_format_datetime_string."""
+        try:
+            expected_result = to_iso_format_datetime_string(datetime_str)
+        except ValueError:
+            with self.assertRaises(ValueError):
+                _to_epoch_time_string(datetime_str)
+        else:
+            self.assertEqual(_to_epoch_time_string(datetime_str), expected_result)
+
+    def test_valid_strings(self):
+        """Unit test for parsing the UTC datetime strings in the message format."""
+        for datetime_str in VALID_UTC_DATETIME_STRINGS:
+            with self.subTest(datetime_str=datetime_str):
+                self.assertEqual(_parse_utc_datetime_string(datetime_str), to_iso_format_datetime_string(datetime_str))
+                self.assert_same_conversion(datetime_str)
+                # the second conversion uses the cached result
+                self.assert_same_conversion(datetime_str)
+
+    def test_other_strings(self):
+        """Unit test for leaving the invalid and the differently formatted strings to the generic conversion."""
+        for datetime_str in OTHER_DATETIME_STRINGS:
+            with self.subTest(datetime_str=datetime_str):
+                self.assertIsNone(_parse_utc_datetime_string(datetime_str))
+                self.assert_same_conversion(datetime_str)
+                self.assert_same_conversion(datetime_str)
+
+    def test_invalid_date(self):
+        """Unit test for rejecting a non-existing date in an epoch message."""
+        message_json = {**FULL_JSON, START_TIME_ATTRIBUTE: "2020-02-30T00:00:00Z"}
+        with self.assertRaises((ValueError, tools.exceptions.messages.MessageDateError)):
+            tools.messages.EpochMessage(**message_json)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,38 +14,43 @@ from tools.tools import FullLogger
 LOGGER = FullLogger(__name__)
 
 UTC_TIMEZONE_MARK = "Z"
+UTC_TIMEZONE = datetime.timezone.utc
+UTC_OFFSET = "+00:00"
 DIGITS_IN_MILLISECONDS = 3
 
 
 def get_utcnow_in_milliseconds() -> str:
     """Returns the current ISO 8601 format datetime string in UTC timezone."""
-    isoformat_with_milliseconds = isoformat_to_milliseconds(datetime.datetime.utcnow().isoformat())
-    if isoformat_with_milliseconds is None:
-        LOGGER.error("Unexpected error when trying to get current time in ISO 8601 format")
-        return "1970-01-01T00:00:00.000Z"
+    return _utc_datetime_to_string(datetime.datetime.now(UTC_TIMEZONE))
 
-    return isoformat_with_milliseconds + UTC_TIMEZONE_MARK
+
+def _utc_datetime_to_string(datetime_value: datetime.datetime) -> str:
+    """Returns the given UTC datetime as ISO 8601 formatted string in millisecond precision.
+       Any timezone information in the given datetime object is ignored."""
+    return (
+        f"{datetime_value.year:04d}-{datetime_value.month:02d}-{datetime_value.day:02d}T"
+        f"{datetime_value.hour:02d}:{datetime_value.minute:02d}:{datetime_value.second:02d}."
+        f"{datetime_value.microsecond // 1000:03d}{UTC_TIMEZONE_MARK}"
+    )
 
 
 def to_iso_format_datetime_string(datetime_value: Union[str, datetime.datetime]) -> Union[str, None]:
     """Returns the given datetime value as ISO 8601 formatted string in UTC timezone.
        Accepts either datetime objects or strings.
        Return None if the given values was invalid."""
-    if isinstance(datetime_value, datetime.datetime):
-        isoformat_with_milliseconds = isoformat_to_milliseconds(
-            datetime_value.astimezone(datetime.timezone.utc).isoformat())
-        if isoformat_with_milliseconds is None:
-            return None
-        return isoformat_with_milliseconds + UTC_TIMEZONE_MARK
     if isinstance(datetime_value, str):
-        datetime_object = to_utc_datetime_object(datetime_value)
-        return to_iso_format_datetime_string(datetime_object)
-    return None
+        datetime_value = to_utc_datetime_object(datetime_value)
+    elif not isinstance(datetime_value, datetime.datetime):
+        return None
+    return _utc_datetime_to_string(datetime_value.astimezone(UTC_TIMEZONE))
 
 
 def to_utc_datetime_object(datetime_str: str) -> datetime.datetime:
     """Returns a datetime object corresponding to the given ISO 8601 formatted string."""
-    return datetime.datetime.fromisoformat(datetime_str.replace(UTC_TIMEZONE_MARK, "+00:00"))
+    # the timezone mark can only be at the end of the string
+    if datetime_str.endswith(UTC_TIMEZONE_MARK):
+        datetime_str = datetime_str[:-1] + UTC_OFFSET
+    return datetime.datetime.fromisoformat(datetime_str)
 
 
 def isoformat_to_milliseconds(datetime_str: str) -> Union[str, None]:
@@ -55,20 +60,18 @@ def isoformat_to_milliseconds(datetime_str: str) -> Union[str, None]:
     if date_mark_index < 0:
         return None
 
-    plus_mark_index = datetime_str.find("+", date_mark_index)
-    if plus_mark_index >= 0:
-        datetime_str = datetime_str[:plus_mark_index]
-
-    minus_mark_index = datetime_str.find("-", date_mark_index)
-    if minus_mark_index >= 0:
-        datetime_str = datetime_str[:minus_mark_index]
-
-    second_fraction_mark_index = datetime_str.find(".")
-    if second_fraction_mark_index >= 0:
-        number_of_decimals = len(datetime_str) - second_fraction_mark_index
-        return (
-            datetime_str[:second_fraction_mark_index + DIGITS_IN_MILLISECONDS + 1] +
-            "0" * max(DIGITS_IN_MILLISECONDS - number_of_decimals, 0)
-        )
-
-    return datetime_str + "." + "0" * DIGITS_IN_MILLISECONDS
+    # the timezone information starts with either a plus or a minus sign after the date part
+    timezone_mark_index = datetime_str.find("+", date_mark_index)
+    if timezone_mark_index < 0:
+        timezone_mark_index = datetime_str.find("-", date_mark_index)
+    if timezone_mark_index >= 0:
+        datetime_str = datetime_str[:timezone_mark_index]
+
+    second_fraction_mark_index = datetime_str.rfind(".", date_mark_index)
+    if second_fraction_mark_index < 0:
+        return f"{datetime_str}.{'0' * DIGITS_IN_MILLISECONDS}"
+
+    number_of_decimals = len(datetime_str) - second_fraction_mark_index - 1
+    if number_of_decimals >= DIGITS_IN_MILLISECONDS:
+        return datetime_str[:second_fraction_mark_index + DIGITS_IN_MILLISECONDS + 1]
+    return datetime_str + "0" * (DIGITS_IN_MILLISECONDS - number_of_decimals)
@@ -196,14 +196,13 @@ class MongodbClient:
         if not documents or not isinstance(documents, list):
             return []
 
-        # Add the topic attribute to the JSON documents.
-        full_documents = [
-            {
-                **document,
-                MongodbClient.TOPIC_ATTRIBUTE: topic_name
-            }
-            for document, topic_name in documents
-        ]
+        # Add the topic attribute to copies of the JSON documents.
+        topic_attribute = MongodbClient.TOPIC_ATTRIBUTE
+        full_documents = []
+        for document, topic_name in documents:
+            full_document = dict(document)
+            full_document[topic_attribute] = topic_name
+            full_documents.append(full_document)
 
         message_collection_name = self.__get_message_collection(full_documents[0], invalid, default_simulation_id)
         if message_collection_name is None:
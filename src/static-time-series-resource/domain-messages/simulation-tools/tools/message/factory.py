@@ -47,6 +47,12 @@ class MessageFactory:
         """Returns the supported message types as a list of strings."""
         return list(cls.__message_types)
 
+    @classmethod
+    def has_message_type(cls, message_type: str) -> bool:
+        """Returns True if the given message type has been registered to the factory.
+           Unlike get_message_types, does not create a new list for each check."""
+        return isinstance(message_type, str) and message_type in cls.__message_types
+
     @classmethod
     def get_message(cls, message_type: str = None, **kwargs) -> BaseMessage:
         """Returns a message object corresponding the given keyword attributes.
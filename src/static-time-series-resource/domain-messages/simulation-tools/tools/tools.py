@@ -130,6 +130,12 @@ def load_environmental_variables(*env_variable_specifications: EnvironmentVariab
     }
 
 
+def env_str(variable_name: str, default_value: str = "") -> str:
+    """Returns the value of a string valued environment variable or the default value if the variable is not set.
+       Unlike EnvironmentVariable, the value is read directly from the environment at each call."""
+    return os.environ.get(variable_name, default_value)
+
+
 DEFAULT_LOGFILE_NAME = "logfile.log"
 DEFAULT_LOGFILE_FORMAT = " --- ".join([
     "%(asctime)s",